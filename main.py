@@ -300,9 +300,10 @@ class PrismDesktopApp(QObject):
                                 cam_entity_id = btn.config.get('printer_camera_entity')
                                 # Only pull the camera feed if the button is large enough to display it (2x2+)
                                 # OR if the 3D printer overlay is currently active and belongs to this button
+                                # (check the config first so an unused printer overlay isn't constructed)
                                 is_active_overlay = (
-                                    self.dashboard.overlay_manager.printer_overlay.isVisible() and
                                     self.dashboard.overlay_manager._active_printer_config and
+                                    self.dashboard.overlay_manager.printer_overlay.isVisible() and
                                     self.dashboard.overlay_manager._active_printer_config.get('printer_camera_entity') == cam_entity_id
                                 )
                                 
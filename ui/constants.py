@@ -40,6 +40,15 @@ def calculate_width(cols: int) -> int:
     return inner + GRID_MARGIN_LEFT + GRID_MARGIN_RIGHT + (ROOT_MARGIN * 2)
 
 
+def calculate_height(rows: int) -> int:
+    """Calculate the total window height for a given number of rows.
+    
+    Layout: grid (rows * BUTTON_HEIGHT + spacing) + grid margins + footer + footer margin + root margins
+    """
+    grid_h = rows * BUTTON_HEIGHT + (rows - 1) * BUTTON_SPACING
+    return grid_h + GRID_MARGIN_TOP + GRID_MARGIN_BOTTOM + FOOTER_HEIGHT + FOOTER_MARGIN_BOTTOM + (ROOT_MARGIN * 2)
+
+
 def calculate_footer_btn_width(cols: int) -> int:
     """Calculate footer button width for a given number of columns.
     
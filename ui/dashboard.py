@@ -4,6 +4,7 @@ The main popup menu with 4x2 grid of buttons/widgets.
 """
 
 import asyncio
+import struct
 import sys
 import time
 import platform
@@ -14,7 +15,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import (
     Qt, QPoint, QPointF, pyqtSignal, QPropertyAnimation, QEasingCurve, 
-    QMimeData, QByteArray, QDataStream, QIODevice, pyqtProperty, QRectF, QTimer, QRect,
+    QMimeData, QByteArray, pyqtProperty, QRectF, QTimer, QRect,
     pyqtSlot, QUrl, QSize
 
 )
@@ -31,11 +32,11 @@ from ui.widgets.dashboard_button import DashboardButton, MIME_TYPE
 from ui.widgets.footer_button import FooterButton
 from ui.constants import (
     WINDOW_WIDTH, DEFAULT_COLS,
-    BUTTON_HEIGHT, BUTTON_WIDTH, BUTTON_SPACING, 
+    BUTTON_WIDTH, BUTTON_SPACING, 
     GRID_MARGIN_LEFT, GRID_MARGIN_RIGHT, GRID_MARGIN_TOP, GRID_MARGIN_BOTTOM,
     FOOTER_HEIGHT, FOOTER_MARGIN_BOTTOM,
     ANIM_DURATION_ENTRANCE, ANIM_DURATION_HEIGHT, ANIM_DURATION_WIDTH, ANIM_DURATION_BORDER,
-    ROOT_MARGIN, RESIZE_MARGIN, calculate_width, calculate_footer_btn_width
+    ROOT_MARGIN, RESIZE_MARGIN, calculate_width, calculate_height, calculate_footer_btn_width
 )
 from ui.managers.overlay_manager import OverlayManager
 from ui.managers.grid_manager import GridManager, VirtualButton
@@ -46,12 +47,69 @@ from ui.visuals.dashboard_effects import (
     draw_liquid_mercury_border, capture_glass_background
 )
 
+# Drag-resize snap candidates: (count, window size), 2-6 rows and 4-8 cols
+_ROW_HEIGHTS = tuple((r, calculate_height(r)) for r in range(2, 7))
+_COL_WIDTHS = tuple((c, calculate_width(c)) for c in range(4, 9))
+
 
 class FrozenScrollArea(QScrollArea):
     """ScrollArea that disables wheel scrolling."""
     def wheelEvent(self, event):
         event.accept()
 
+class ResizeOutline(QWidget):
+    """Frameless outline previewing the target window geometry during drag-resize."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowFlags(
+            Qt.WindowType.FramelessWindowHint |
+            Qt.WindowType.Tool |
+            Qt.WindowType.WindowStaysOnTopHint |
+            Qt.WindowType.WindowTransparentForInput
+        )
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating)
+        self._color = QColor("#0078d4")
+
+    def set_color(self, color: QColor):
+        self._color = QColor(color)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(self._color, 2, Qt.PenStyle.DashLine))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawRoundedRect(QRectF(self.rect()).adjusted(1, 1, -1, -1), 12, 12)
+        painter.end()
+
+
+class ResizeGutter(QWidget):
+    """Invisible strip along a dashboard edge that handles drag-to-resize."""
+    def __init__(self, dashboard, edge: str):
+        super().__init__(dashboard)
+        self._dashboard = dashboard
+        self.edge = edge # 'top', 'bottom' or 'left'
+        if edge == 'left':
+            self.setCursor(Qt.CursorShape.SizeHorCursor)
+        else:
+            self.setCursor(Qt.CursorShape.SizeVerCursor)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._dashboard._begin_window_resize(self.edge, event.globalPosition().toPoint())
+            event.accept()
+            return
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        self._dashboard._drag_window_resize(event.globalPosition().toPoint())
+        event.accept()
+
+    def mouseReleaseEvent(self, event):
+        self._dashboard._end_window_resize()
+        event.accept()
+
+
 class Dashboard(QWidget):
     """Main dashboard popup widget with dynamic grid."""
     
@@ -79,6 +137,7 @@ class Dashboard(QWidget):
         self._rows = rows
         self._cols = cols
         self.buttons: list[DashboardButton] = []
+        self._buttons_by_slot: dict[int, DashboardButton] = {} # slot -> button, refreshed via reindex_buttons()
         self._button_pool: list[DashboardButton] = []  # Pool for recycled buttons
         self._button_configs: list[dict] = []
         self._entity_states: dict = {} # Map entity_id -> full state dict
@@ -97,10 +156,10 @@ class Dashboard(QWidget):
         self.border_anim.setEasingCurve(QEasingCurve.Type.InOutQuad)
         
         # Overlay Manager
-        self.overlay_manager = OverlayManager(self, self.theme_manager)
+        self.overlay_manager = OverlayManager(self, self.theme_manager, button_lookup=self.button_at)
         self.overlay_manager.update_buttons(self.buttons)
         self.overlay_manager.update_states(self._entity_states)
-        self.overlay_manager.service_request.connect(self.button_clicked.emit)
+        self.overlay_manager.service_request.connect(self.button_clicked) # signal-to-signal, no Python hop
         
         # Throttling
 
@@ -129,16 +188,24 @@ class Dashboard(QWidget):
         self._fixed_width = calculate_width(self._cols)  # Dynamic width based on cols
         
         # Window Resize Logic
-        self.setMouseTracking(True) # Enable hover events for cursor change
-        QApplication.instance().installEventFilter(self)  # Track mouse globally for cursor reset
+        # No mouse tracking needed: resize cursors live on the edge gutters,
+        # which are hidden outside grid view, so Qt handles hover without events.
         self._is_resizing_window = False
-        self._resize_mode = None # 'top', 'left', 'top-left'
+        self._resize_mode = None # 'top', 'bottom' or 'left'
         self._resize_start_pos = None # Global pos
         self._resize_start_geo = None # (x, y, w, h)
         self._resize_start_rows = rows
         self._resize_start_cols = cols
+        self._resize_target_rows = rows # Rows/cols to commit on release
+        self._resize_target_cols = cols
+        self._resize_outline = None # Created lazily on first drag
+        self._create_resize_gutters()
         
         self._ignore_focus_loss = False  # Guard for resize release outside window
+        self._ignore_focus_timer = QTimer(self)
+        self._ignore_focus_timer.setSingleShot(True)
+        self._ignore_focus_timer.setInterval(500)
+        self._ignore_focus_timer.timeout.connect(self._clear_ignore_focus_loss)
         
         # Drag & Drop
         self.setAcceptDrops(True)
@@ -169,6 +236,8 @@ class Dashboard(QWidget):
         # Serialize: Check for pending width changes after height finishes
         self._pending_resize_cols = None
         self._pending_rows_update = None # Store pending rows change (for phased animation)
+        self._pending_rows = None # Row change deferred while settings are open
+        self._pending_cols = None # Col change deferred while settings are open
         self.height_anim.finished.connect(self._on_height_anim_finished)
         
         # Window Width Animation
@@ -179,6 +248,12 @@ class Dashboard(QWidget):
         self.width_anim.finished.connect(self._on_width_anim_finished)
 
         self._last_tray_geometry = QRect()
+        self._connected_screens = [] # Screens whose geometry signals are hooked up
+        self._avail_geom_cache = None # (screen, availableGeometry) used by _reposition_after_morph
+        self._cached_screen = None # Screen the window lives on (tracked via windowHandle().screenChanged)
+        self._screen_tracking_connected = False
+        self._last_anchor_key = None # (w, h, screen, top_anchored) of the last _reposition_after_morph
+        self._last_anchor_pos = None
 
         # React to screen geometry changes (panel settling on startup, resolution, monitor changes)
         self._connect_screen_signals(self.screen() or QApplication.primaryScreen())
@@ -187,19 +262,49 @@ class Dashboard(QWidget):
                                                      self._on_screen_geometry_changed()))
         app.screenAdded.connect(lambda s: (self._connect_screen_signals(s),
                                             self._on_screen_geometry_changed()))
+        app.screenRemoved.connect(self._on_screen_removed)
 
     def _connect_screen_signals(self, screen):
         """Connect per-screen geometry signals to the reposition slot."""
-        if not screen:
+        if not screen or screen in self._connected_screens:
             return
+        self._connected_screens.append(screen)
         screen.availableGeometryChanged.connect(self._on_screen_geometry_changed)
         screen.geometryChanged.connect(self._on_screen_geometry_changed)
 
+    def _on_screen_removed(self, screen):
+        """Forget a disconnected screen and any geometry cached for it."""
+        if screen in self._connected_screens:
+            self._connected_screens.remove(screen)
+        if screen is self._cached_screen:
+            self._cached_screen = None
+        self._invalidate_geom_cache()
+
+    def _invalidate_geom_cache(self):
+        """Drop cached screen geometry so the next reposition re-reads it."""
+        self._avail_geom_cache = None
+        self._last_anchor_key = None
+
     def _on_screen_geometry_changed(self, _rect=None):
         """Slot for any screen geometry change. Defers to next event loop tick
         so cascading X11 geometry updates have settled before we read them."""
+        self._invalidate_geom_cache()
         QTimer.singleShot(0, lambda: self.refresh_tray_anchor(move_now=True))
 
+    def _on_screen_changed(self, screen):
+        """Track the screen the window is on so repositioning doesn't re-query it."""
+        self._cached_screen = screen
+        self._invalidate_geom_cache()
+        self._connect_screen_signals(screen)
+
+    def _available_geometry(self, screen) -> QRect:
+        """Available geometry of screen, cached until a screen change invalidates it."""
+        cache = self._avail_geom_cache
+        if cache is None or cache[0] is not screen:
+            cache = (screen, screen.availableGeometry())
+            self._avail_geom_cache = cache
+        return cache[1]
+
     def _screen_for_tray_geometry(self, tray_geometry: QRect | None = None):
         """Choose the screen containing the tray icon when Qt reports it."""
         if tray_geometry and not tray_geometry.isNull():
@@ -226,21 +331,9 @@ class Dashboard(QWidget):
              return
              
         # Decode source slot to get span
-        data = event.mimeData().data(MIME_TYPE)
-        stream = QDataStream(data, QIODevice.OpenModeFlag.ReadOnly)
-        source_slot = stream.readInt32()
+        source_slot = struct.unpack('>i', event.mimeData().data(MIME_TYPE).data()[:4])[0]
         
-        source_btn = next((b for b in self.buttons if b.slot == source_slot), None)
-        if not source_btn:
-            event.ignore()
-            return
-
-        # Decode source slot to get span
-        data = event.mimeData().data(MIME_TYPE)
-        stream = QDataStream(data, QIODevice.OpenModeFlag.ReadOnly)
-        source_slot = stream.readInt32()
-        
-        source_btn = next((b for b in self.buttons if b.slot == source_slot), None)
+        source_btn = self.button_at(source_slot)
         if not source_btn:
             event.ignore()
             return
@@ -274,7 +367,7 @@ class Dashboard(QWidget):
                  return
 
              # Block if target is forbidden
-             target_btn = next((b for b in self.buttons if b.slot == target_slot), None)
+             target_btn = self.button_at(target_slot)
              if target_btn and target_btn.config and target_btn.config.get('type') == 'forbidden':
                   event.ignore()
                   return
@@ -304,7 +397,7 @@ class Dashboard(QWidget):
         if target_slot != -1 and target_slot != source_slot:
             # 1. Bounds Check
             # Get source button to check dimensions
-            source_btn = next((b for b in self.buttons if b.slot == source_slot), None)
+            source_btn = self.button_at(source_slot)
             
             if source_btn:
                 target_row = target_slot // self._cols
@@ -316,7 +409,7 @@ class Dashboard(QWidget):
                     return
 
             # 2. Forbidden Check
-            target_btn = next((b for b in self.buttons if b.slot == target_slot), None)
+            target_btn = self.button_at(target_slot)
             if target_btn and target_btn.config and target_btn.config.get('type') == 'forbidden':
                 return
                 
@@ -391,20 +484,25 @@ class Dashboard(QWidget):
 
     def set_rows(self, rows: int):
         """Set number of rows and rebuild grid."""
-        if self._rows != rows:
-            # FIX: If we're currently showing settings, defer the rebuild until
-            # the hide_settings animation completes.
-            if self._current_view == 'settings':
-                self._pending_rows = rows
-                return
-            
-            self._do_set_rows(rows)
+        # Compare against the in-flight target so repeated drag steps don't
+        # restart the height animation for a row count already being applied.
+        current_rows = self._pending_rows_update if self._pending_rows_update is not None else self._rows
+        if rows == current_rows:
+            return
+
+        # FIX: If we're currently showing settings, defer the rebuild until
+        # the hide_settings animation completes.
+        if self._current_view == 'settings':
+            self._pending_rows = rows
+            return
+        
+        self._do_set_rows(rows)
     
     def handle_button_resize(self, slot_idx, span_x, span_y):
         """Handle resize request from a button."""
         
         # Find the button and its config by runtime slot
-        source_btn = next((b for b in self.buttons if b.slot == slot_idx), None)
+        source_btn = self.button_at(slot_idx)
         if not source_btn or not source_btn.config:
             return
         
@@ -485,15 +583,21 @@ class Dashboard(QWidget):
     def get_first_empty_slot(self, span_x: int = 1, span_y: int = 1) -> tuple:
         """Find the first visible (row, col) that is completely empty and fits the span."""
         return self.grid_manager.layout_engine.find_first_empty_slot(self.buttons, self._rows, span_x, span_y)
-            
+
+    def reindex_buttons(self):
+        """Re-index buttons by runtime slot. Called by GridManager.rebuild_grid after slots are reassigned."""
+        # Reversed so the first button with a given slot wins, like a linear scan would
+        self._buttons_by_slot = {b.slot: b for b in reversed(self.buttons)}
+
+    def button_at(self, slot: int):
+        """Return the button currently placed at a runtime slot, or None."""
+        return self._buttons_by_slot.get(slot)
+
     def _do_set_rows(self, rows: int):
         """Update grid rows dynamically (Animate First, Rebuild Later)."""
         
         # Calculate target height for the NEW row count
-        # grid_h calculation moved here (Phase 1)
-        grid_h = (rows * BUTTON_HEIGHT) + ((rows - 1) * BUTTON_SPACING)
-        extras = GRID_MARGIN_TOP + GRID_MARGIN_BOTTOM + FOOTER_HEIGHT + FOOTER_MARGIN_BOTTOM + (2 * ROOT_MARGIN)
-        target_h = grid_h + extras
+        target_h = calculate_height(rows)
         
         # Store pending update
         self._pending_rows_update = rows
@@ -584,9 +688,7 @@ class Dashboard(QWidget):
             self._pending_rows_update = None
             
             # Lock size to new calculated height
-            grid_h = (self._rows * BUTTON_HEIGHT) + ((self._rows - 1) * BUTTON_SPACING)
-            extras = GRID_MARGIN_TOP + GRID_MARGIN_BOTTOM + FOOTER_HEIGHT + FOOTER_MARGIN_BOTTOM + (2 * ROOT_MARGIN)
-            self.setFixedSize(self._fixed_width, int(grid_h + extras))
+            self.setFixedSize(self._fixed_width, calculate_height(self._rows))
             
             if self._current_view == 'grid':
                 self._fade_in_footer()
@@ -664,7 +766,7 @@ class Dashboard(QWidget):
         # Lock size after height animation
         self.setFixedSize(self.width(), self.height())
         
-        if getattr(self, '_pending_resize_cols', None) is not None:
+        if self._pending_resize_cols is not None:
              cols = self._pending_resize_cols
              self._pending_resize_cols = None
              # Use do_set_cols directly as self._cols is already updated
@@ -672,16 +774,19 @@ class Dashboard(QWidget):
 
     def set_cols(self, cols: int):
         """Set number of columns and rebuild grid."""
-        if self._cols != cols:
-            # Always update _cols and _fixed_width immediately so setup_ui uses the right values
-            self._cols = cols
-            self._fixed_width = calculate_width(cols)
-            self.grid_manager.update_cols(cols)
-            
-            if self._current_view == 'settings':
-                self._pending_cols = cols
-                return
-            self._do_set_cols(cols)
+        # _cols is updated eagerly below, so it already reflects any in-flight change
+        if cols == self._cols:
+            return
+
+        # Always update _cols and _fixed_width immediately so setup_ui uses the right values
+        self._cols = cols
+        self._fixed_width = calculate_width(cols)
+        self.grid_manager.update_cols(cols)
+        
+        if self._current_view == 'settings':
+            self._pending_cols = cols
+            return
+        self._do_set_cols(cols)
     
     def _do_set_cols(self, cols: int):
         """Phase 1: Animate window width (defer grid rebuild)."""
@@ -787,9 +892,7 @@ class Dashboard(QWidget):
         self.save_config_requested.emit()
         
         # Store grid height
-        grid_h = (self._rows * BUTTON_HEIGHT) + ((self._rows - 1) * BUTTON_SPACING)
-        extras = GRID_MARGIN_TOP + GRID_MARGIN_BOTTOM + FOOTER_HEIGHT + FOOTER_MARGIN_BOTTOM + 20
-        self._grid_height = grid_h + extras
+        self._grid_height = calculate_height(self._rows)
         # Lock only at the VERY end
         if self.height_anim.state() != QPropertyAnimation.State.Running:
              self.setFixedSize(self.width(), self.height())
@@ -968,12 +1071,7 @@ class Dashboard(QWidget):
         
         # Size Calculation
         width = calculate_width(self._cols)
-        # Height: Grid rows*80 + (rows-1)*8 + Grid top(12) + Grid bot(8) + Footer(26) + Footer bot(12) + Root margins(20)
-        # = (rows*80) + (rows-1)*8 + 12 + 8 + 26 + 12 + 20
-        # = (rows*80) + (rows*8) - 8 + 78
-        grid_h = (self._rows * BUTTON_HEIGHT) + ((self._rows - 1) * BUTTON_SPACING)
-        extras = GRID_MARGIN_TOP + GRID_MARGIN_BOTTOM + FOOTER_HEIGHT + FOOTER_MARGIN_BOTTOM + 20   # 78
-        height = grid_h + extras
+        height = calculate_height(self._rows)
         self.setFixedSize(width, height)
     def open_ha(self):
         """Open Home Assistant in default browser."""
@@ -1476,6 +1574,13 @@ class Dashboard(QWidget):
     def showEvent(self, event):
         """Standard show event."""
         super().showEvent(event)
+        # windowHandle() only exists once the native window is created
+        if not self._screen_tracking_connected:
+            handle = self.windowHandle()
+            if handle:
+                handle.screenChanged.connect(self._on_screen_changed)
+                self._cached_screen = handle.screen()
+                self._screen_tracking_connected = True
         # We handle animation in show_near_tray usually, but for safety:
         self.activateWindow()
         self.setFocus()
@@ -1724,6 +1829,7 @@ class Dashboard(QWidget):
             
         # 2. Update view state
         self._current_view = view_name
+        self._update_resize_gutters()
         
         # 3. Calculate heights (Moved up so we can use it for capture)
         start_height = self.height()
@@ -1879,7 +1985,7 @@ class Dashboard(QWidget):
             self.grid_widget.setMaximumSize(16777215, 16777215)
         
             # FIX: Process pending row change if any (deferred from set_rows)
-            pending = getattr(self, '_pending_rows', None)
+            pending = self._pending_rows
             if pending is not None:
                 self._pending_rows = None
                 self._do_set_rows(pending)
@@ -1890,7 +1996,7 @@ class Dashboard(QWidget):
                 self._reposition_after_morph()
             
             # FIX: Process pending col change if any (deferred from set_cols)
-            pending_cols = getattr(self, '_pending_cols', None)
+            pending_cols = self._pending_cols
             if pending_cols is not None:
                 self._pending_cols = None
                 self._do_set_cols(pending_cols)
@@ -1919,201 +2025,158 @@ class Dashboard(QWidget):
     
     def _reposition_after_morph(self):
         """Reposition window to keep it anchored to the configured tray edge."""
-        try:
-            screen = self.screen()
-        except:
-            screen = QApplication.primaryScreen()
-            
-        if not screen:
-            screen = QApplication.primaryScreen()
-            
+        screen = self._cached_screen or QApplication.primaryScreen()
         if not screen:
             return
-        screen_rect = screen.availableGeometry()
+
+        # Skip if nothing affecting the anchor changed since the last reposition
+        # and the window hasn't been moved elsewhere in the meantime
+        top_anchored = self._is_top_anchored()
+        anchor_key = (self.width(), self.height(), screen, top_anchored)
+        if anchor_key == self._last_anchor_key and self.pos() == self._last_anchor_pos:
+            return
+
+        screen_rect = self._available_geometry(screen)
         x = screen_rect.right() - self.width() - 10
-        if self._is_top_anchored():
+        if top_anchored:
             y = screen_rect.top() + 10
         else:
             y = screen_rect.bottom() - self.height() - 10
-        self.move(x, y)
+        # Single atomic geometry request (matches set_anim_width)
+        self.setGeometry(x, y, self.width(), self.height())
+        self._last_anchor_key = anchor_key
+        self._last_anchor_pos = QPoint(x, y)
 
     # ============ DRAG TO RESIZE HANDLERS ============
-    
-    def mousePressEvent(self, event):
-        """Handle window resize drag start."""
-        # Only allow resizing in Grid View
-        if self._current_view != 'grid':
-            super().mousePressEvent(event)
-            return
-
-        if event.button() == Qt.MouseButton.LeftButton:
-            x = event.position().x()
-            y = event.position().y()
-            vertical_resize_from_bottom = self._is_top_anchored()
-
-            # Identify resize zone
-            mode = None
-            # Disable corner drag. When the window is top-anchored, use the
-            # bottom edge so row growth happens downward instead of upward.
-            if vertical_resize_from_bottom:
-                if y > self.height() - RESIZE_MARGIN:
-                    mode = 'bottom'
-                elif x < RESIZE_MARGIN:
-                    mode = 'left'
-            elif y < RESIZE_MARGIN:
-                mode = 'top'
-            elif x < RESIZE_MARGIN:
-                mode = 'left'
-
-            if mode:
-                self._is_resizing_window = True
-                self._resize_mode = mode
-                self._resize_start_pos = event.globalPosition().toPoint()
-                self._resize_start_geo = (self.x(), self.y(), self.width(), self.height())
-                self._resize_start_rows = self._rows
-                self._resize_start_cols = self._cols
-                event.accept()
-                return
-
-        super().mousePressEvent(event)
 
-    def leaveEvent(self, event):
-        """Reset cursor when mouse leaves window."""
-        # Only reset if not currently dragging
+    def _create_resize_gutters(self):
+        """Create the edge strips that handle drag-to-resize."""
+        self._left_gutter = ResizeGutter(self, 'left')
+        self._top_gutter = ResizeGutter(self, 'top')
+        self._bottom_gutter = ResizeGutter(self, 'bottom')
+        self._update_resize_gutters()
+
+    def _update_resize_gutters(self):
+        """Show the gutters that apply to the current view and tray anchor."""
+        # Resizing is only allowed in Grid View. When the window is top-anchored,
+        # use the bottom edge so row growth happens downward instead of upward.
+        in_grid = self._current_view == 'grid'
+        top_anchored = self._is_top_anchored()
+        self._left_gutter.setVisible(in_grid)
+        self._top_gutter.setVisible(in_grid and not top_anchored)
+        self._bottom_gutter.setVisible(in_grid and top_anchored)
+        self._layout_resize_gutters()
+
+    def _layout_resize_gutters(self):
+        """Stretch the gutters along their window edges, above the content."""
+        w, h = self.width(), self.height()
+        self._left_gutter.setGeometry(0, 0, RESIZE_MARGIN, h)
+        self._top_gutter.setGeometry(0, 0, w, RESIZE_MARGIN)
+        self._bottom_gutter.setGeometry(0, h - RESIZE_MARGIN, w, RESIZE_MARGIN)
+        # Vertical edges win over the left edge in the corners (no corner drag)
+        self._left_gutter.raise_()
+        self._top_gutter.raise_()
+        self._bottom_gutter.raise_()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._layout_resize_gutters()
+
+    def _begin_window_resize(self, mode: str, global_pos: QPoint):
+        """Start a drag-resize from one of the gutters."""
+        self._is_resizing_window = True
+        self._resize_mode = mode
+        self._resize_start_pos = global_pos
+        self._resize_start_geo = (self.x(), self.y(), self.width(), self.height())
+        self._resize_start_rows = self._rows
+        self._resize_start_cols = self._cols
+        self._resize_target_rows = self._rows
+        self._resize_target_cols = self._cols
+
+    def _drag_window_resize(self, global_pos: QPoint):
+        """Update the resize preview for the current drag position."""
         if not self._is_resizing_window:
-            self.unsetCursor()
-        super().leaveEvent(event)
-
-    def eventFilter(self, obj, event):
-        """App-level event filter to reset resize cursor when mouse moves over child widgets."""
-        from PyQt6.QtCore import QEvent
-        if (event.type() == QEvent.Type.MouseMove
-                and not self._is_resizing_window
-                and self._current_view == 'grid'
-                and isinstance(obj, QWidget)
-                and (obj is self or self.isAncestorOf(obj))):
-            pos = self.mapFromGlobal(event.globalPosition().toPoint())
-            near_vertical_resize = (
-                pos.y() > self.height() - RESIZE_MARGIN
-                if self._is_top_anchored()
-                else pos.y() < RESIZE_MARGIN
-            )
-            if not near_vertical_resize and pos.x() >= RESIZE_MARGIN:
-                self.unsetCursor()
-        return super().eventFilter(obj, event)
-
-    def mouseMoveEvent(self, event):
-        """Handle resize drag and hover cursor."""
-        # Only allow resizing in Grid View
-        if self._current_view != 'grid':
-            self.unsetCursor()
-            super().mouseMoveEvent(event)
             return
 
-        x = event.position().x()
-        y = event.position().y()
-        vertical_resize_from_bottom = self._is_top_anchored()
-
-        if not self._is_resizing_window:
-            if vertical_resize_from_bottom:
-                if y > self.height() - RESIZE_MARGIN:
-                    self.setCursor(Qt.CursorShape.SizeVerCursor)
-                elif x < RESIZE_MARGIN:
-                    self.setCursor(Qt.CursorShape.SizeHorCursor)
-                else:
-                    self.unsetCursor()
-            elif y < RESIZE_MARGIN:
-                self.setCursor(Qt.CursorShape.SizeVerCursor)
-            elif x < RESIZE_MARGIN:
-                self.setCursor(Qt.CursorShape.SizeHorCursor)
-            else:
-                self.unsetCursor()
-            super().mouseMoveEvent(event)
-            return
-
-        # Drag Logic
-        delta = event.globalPosition().toPoint() - self._resize_start_pos
+        delta = global_pos - self._resize_start_pos
         dx = delta.x()
         dy = delta.y()
 
         target_rows = self._resize_start_rows
         target_cols = self._resize_start_cols
 
-        if 'top' in self._resize_mode:
+        # _resize_mode is a single edge ('top', 'bottom' or 'left'), so compare directly
+        mode = self._resize_mode
+        if mode == 'top':
             start_h = self._resize_start_geo[3]
             new_h = start_h - dy
             target_rows = self._get_rows_at_height(new_h)
-        elif 'bottom' in self._resize_mode:
+        elif mode == 'bottom':
             start_h = self._resize_start_geo[3]
             new_h = start_h + dy
             target_rows = self._get_rows_at_height(new_h)
-
-        if 'left' in self._resize_mode:
+        elif mode == 'left':
             start_w = self._resize_start_geo[2]
             new_w = start_w - dx
             target_cols = self._get_cols_at_width(new_w)
 
-        # Apply Changes (Snap)
-        current_rows = getattr(self, '_pending_rows_update', None)
-        if current_rows is None:
-            current_rows = self._rows
+        # Preview only - the grid is rebuilt once on release
+        if target_rows != self._resize_target_rows or target_cols != self._resize_target_cols:
+            self._resize_target_rows = target_rows
+            self._resize_target_cols = target_cols
+            self._update_resize_outline()
+
+    def _update_resize_outline(self):
+        """Show the drag-resize outline at the geometry the window will snap to."""
+        x, y, w, h = self._resize_start_geo
+        target_w = calculate_width(self._resize_target_cols)
+        target_h = calculate_height(self._resize_target_rows)
+
+        if (target_w, target_h) == (w, h):
+            if self._resize_outline:
+                self._resize_outline.hide()
+            return
 
-        if target_rows != current_rows:
-            self.set_rows(target_rows)
+        # Grow away from the edge being dragged; the opposite edge stays anchored
+        if self._resize_mode == 'top':
+            y = y + h - target_h
+        elif self._resize_mode == 'left':
+            x = x + w - target_w
 
-        if target_cols != self._cols:
-            self.set_cols(target_cols)
+        if self._resize_outline is None:
+            self._resize_outline = ResizeOutline(self)
+        if self.theme_manager:
+            self._resize_outline.set_color(QColor(self.theme_manager.get_colors().get('accent', '#0078d4')))
+        self._resize_outline.setGeometry(x, y, target_w, target_h)
+        self._resize_outline.show()
 
-        event.accept()
+    def _end_window_resize(self):
+        """Finish a drag-resize and apply the previewed size."""
+        if not self._is_resizing_window:
+            return
+        self._is_resizing_window = False
+        self._resize_mode = None
 
-    def mouseReleaseEvent(self, event):
-        """End resize drag."""
-        if self._is_resizing_window:
-            self._is_resizing_window = False
-            self._resize_mode = None
-            self.unsetCursor()
+        if self._resize_outline:
+            self._resize_outline.hide()
 
-            # Prevent focus-loss close for a brief moment
-            # (In case mouse release happened outside window)
-            self._ignore_focus_loss = True
-            QTimer.singleShot(500, lambda: setattr(self, '_ignore_focus_loss', False))
+        # Commit the final size in one go (no-ops when unchanged)
+        self.set_rows(self._resize_target_rows)
+        self.set_cols(self._resize_target_cols)
 
-            event.accept()
-            return
-        super().mouseReleaseEvent(event)
+        # Prevent focus-loss close for a brief moment
+        # (In case mouse release happened outside window)
+        self._ignore_focus_loss = True
+        self._ignore_focus_timer.start()
+
+    def _clear_ignore_focus_loss(self):
+        """Re-enable close-on-focus-loss after a resize drag."""
+        self._ignore_focus_loss = False
 
     def _get_rows_at_height(self, target_h):
         """Find nearest row count for a target window height."""
-        best_rows = self._rows
-        min_diff = float('inf')
-        
-        # Calculate height for 2 to 6 rows
-        for r in range(2, 7):
-            # Calculate grid height
-            grid_h = (r * BUTTON_HEIGHT) + ((r - 1) * BUTTON_SPACING)
-            # Match calculation from _do_set_rows:
-            # grid_h + GRID_MARGIN_TOP + GRID_MARGIN_BOTTOM + FOOTER_HEIGHT + FOOTER_MARGIN_BOTTOM + (2 * ROOT_MARGIN)
-            extras = GRID_MARGIN_TOP + GRID_MARGIN_BOTTOM + FOOTER_HEIGHT + FOOTER_MARGIN_BOTTOM + (2 * ROOT_MARGIN)
-            calc_h = grid_h + extras
-            
-            diff = abs(calc_h - target_h)
-            if diff < min_diff:
-                min_diff = diff
-                best_rows = r
-                
-        return best_rows
+        return min(_ROW_HEIGHTS, key=lambda item: abs(item[1] - target_h))[0]
 
     def _get_cols_at_width(self, target_w):
         """Find nearest col count for a target window width."""
-        best_cols = self._cols
-        min_diff = float('inf')
-        
-        # 4 to 6 cols
-        for c in range(4, 9): 
-            calc_w = calculate_width(c)
-            diff = abs(calc_w - target_w)
-            if diff < min_diff:
-                min_diff = diff
-                best_cols = c
-                
-        return best_cols
+        return min(_COL_WIDTHS, key=lambda item: abs(item[1] - target_w))[0]
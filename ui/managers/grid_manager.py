@@ -1,5 +1,5 @@
 from ui.grid_layout_engine import GridLayoutEngine
-from ui.constants import BUTTON_HEIGHT, BUTTON_SPACING, GRID_MARGIN_TOP, GRID_MARGIN_BOTTOM, FOOTER_HEIGHT, FOOTER_MARGIN_BOTTOM
+from ui.constants import calculate_height
 from PyQt6.QtCore import QPropertyAnimation
 
 class VirtualButton:
@@ -79,11 +79,12 @@ class GridManager:
             if btn not in placed_buttons:
                 btn.setVisible(False)
         
+        # 4. Slots were reassigned above - refresh the dashboard's slot index
+        self.dashboard.reindex_buttons()
+        
         # 5. Update Height
         if update_height:
-            grid_h = (self.dashboard._rows * BUTTON_HEIGHT) + ((self.dashboard._rows - 1) * BUTTON_SPACING)
-            extras = GRID_MARGIN_TOP + GRID_MARGIN_BOTTOM + FOOTER_HEIGHT + FOOTER_MARGIN_BOTTOM + 20
-            new_height = grid_h + extras
+            new_height = calculate_height(self.dashboard._rows)
             
             start_h = self.dashboard.height()
             if start_h != new_height and self.dashboard._current_view == 'grid':
@@ -1,12 +1,38 @@
-from PyQt6.QtCore import QObject, pyqtSignal, QTimer, QRect, QPoint
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, QTimer, QRect, QPoint
 from PyQt6.QtGui import QColor
 from PyQt6.QtWidgets import QWidget
 
 from ui.widgets.overlays import DimmerOverlay, ClimateOverlay, PrinterOverlay, WeatherOverlay, CameraOverlay, MowerOverlay, VacuumOverlay
 from ui.widgets.dashboard_button import DashboardButton
-from ui.constants import BUTTON_HEIGHT, BUTTON_SPACING
+from ui.constants import BUTTON_HEIGHT, BUTTON_WIDTH, BUTTON_SPACING
 from core.temperature_utils import convert_temperature, convert_temperature_delta, normalize_temperature_unit, preference_to_unit
 
+# Config keys of the entities merged into the printer overlay's virtual state
+PRINTER_ENTITY_KEYS = (
+    'printer_state_entity',
+    'printer_nozzle_entity',
+    'printer_nozzle_target_entity',
+    'printer_bed_entity',
+    'printer_bed_target_entity',
+    'printer_progress_entity',
+)
+
+# Printer overlay action -> config key of the button entity it presses
+_PRINTER_ACTION_KEYS = {
+    'pause': 'printer_pause_entity',
+    'resume': 'printer_pause_entity',
+    'stop': 'printer_stop_entity',
+}
+
+# Shared read-only default for missing entity states/attributes - never mutate
+_EMPTY = {}
+
+# Strips the degree sign and unit letter from displayed temperatures ("21.5°C" -> "21.5")
+_TEMP_UNIT_STRIP = str.maketrans('', '', '°CF')
+
+# Row overlays never grow wider than 6 columns
+MAX_OVERLAY_WIDTH = (6 * BUTTON_WIDTH) + (5 * BUTTON_SPACING)
+
 class OverlayManager(QObject):
     """
     Manages overlay widgets (Dimmer, Climate) and their interactions.
@@ -17,49 +43,23 @@ class OverlayManager(QObject):
     service_request = pyqtSignal(dict)  # Emit service calls (to be connected to HAClient or Dashboard)
     morph_changed = pyqtSignal(float) # Optional: if dashboard needs to know global animation progress
     
-    def __init__(self, parent: QWidget, theme_manager=None):
+    def __init__(self, parent: QWidget, theme_manager=None, button_lookup=None):
         super().__init__(parent)
         self.parent_widget = parent
         self.theme_manager = theme_manager
         
         self.buttons = [] # Reference to dashboard buttons
+        self._button_at = button_lookup or (lambda slot: None) # slot -> button, owned by the dashboard
         self._entity_states = {} # Reference or copy of states
         
-        # Overlays
-        self.dimmer_overlay = DimmerOverlay(parent)
-        self.dimmer_overlay.value_changed.connect(self.on_dimmer_value_changed)
-        self.dimmer_overlay.finished.connect(self.on_dimmer_finished)
-        self.dimmer_overlay.morph_changed.connect(self.on_morph_changed)
-        
-        self.climate_overlay = ClimateOverlay(parent)
-        self.climate_overlay.value_changed.connect(self.on_climate_value_changed)
-        self.climate_overlay.mode_changed.connect(self.on_climate_mode_changed)
-        self.climate_overlay.fan_changed.connect(self.on_climate_fan_changed)
-        self.climate_overlay.finished.connect(self.on_climate_finished)
-        self.climate_overlay.morph_changed.connect(self.on_morph_changed)
-        
-        self.printer_overlay = PrinterOverlay(parent)
-        self.printer_overlay.action_requested.connect(self.on_printer_action)
-        self.printer_overlay.finished.connect(self.on_printer_finished)
-        self.printer_overlay.morph_changed.connect(self.on_morph_changed)
-        
-        self.weather_overlay = WeatherOverlay(parent)
-        self.weather_overlay.finished.connect(self.on_weather_finished)
-        self.weather_overlay.morph_changed.connect(self.on_morph_changed)
-        
-        self.camera_overlay = CameraOverlay(parent)
-        self.camera_overlay.finished.connect(self.on_camera_finished)
-        self.camera_overlay.morph_changed.connect(self.on_morph_changed)
-
-        self.mower_overlay = MowerOverlay(parent)
-        self.mower_overlay.action_requested.connect(self.on_mower_action)
-        self.mower_overlay.finished.connect(self.on_mower_finished)
-        self.mower_overlay.morph_changed.connect(self.on_morph_changed)
-
-        self.vacuum_overlay = VacuumOverlay(parent)
-        self.vacuum_overlay.action_requested.connect(self.on_vacuum_action)
-        self.vacuum_overlay.finished.connect(self.on_vacuum_finished)
-        self.vacuum_overlay.morph_changed.connect(self.on_morph_changed)
+        # Overlays (created on first use, see the *_overlay properties)
+        self._dimmer_overlay = None
+        self._climate_overlay = None
+        self._printer_overlay = None
+        self._weather_overlay = None
+        self._camera_overlay = None
+        self._mower_overlay = None
+        self._vacuum_overlay = None
 
         # State Tracking
         self._active_dimmer_entity = None
@@ -76,6 +76,9 @@ class OverlayManager(QObject):
         
         self._active_printer_entity = None
         self._active_printer_config = None
+        self._active_printer_relevant = frozenset() # Entity ids feeding the printer overlay
+        self._last_printer_digest = None # Raw inputs of the last pushed virtual state
+        self._last_printer_state = None
         self._printer_source_btn = None
         self._printer_siblings = []
         
@@ -104,50 +107,137 @@ class OverlayManager(QObject):
         self.climate_timer.setInterval(500)
         self.climate_timer.timeout.connect(self.process_pending_climate)
         
+        self.printer_timer = QTimer(self)
+        self.printer_timer.setSingleShot(True)
+        self.printer_timer.setInterval(100)
+        self.printer_timer.timeout.connect(self._push_printer_state)
+        
+        self._active_overlay = None  # Name of the overlay last started, cleared when it finishes
+        self._last_sibling_opacity = None # Last opacity step (1/64) applied in on_morph_changed
+        self._sibling_effects = None # Opacity effects of all faded siblings, built on first morph frame
+        
         self._border_effect = 'Rainbow'
         self._live_dimming = True
         self._pending_open_action = None
         self._temperature_unit_preference = "celsius"
+        self._color_cache = {} # hex string -> parsed QColor, see _qcolor()
+
+    # ==========================
+    # Lazy Overlay Construction
+    # ==========================
+
+    def _create_overlay(self, overlay_cls, finished_slot):
+        """Build an overlay on the parent widget with the shared wiring applied."""
+        overlay = overlay_cls(self.parent_widget)
+        overlay.finished.connect(finished_slot)
+        overlay.morph_changed.connect(self.on_morph_changed)
+        overlay.set_border_effect(self._border_effect)
+        return overlay
+
+    @staticmethod
+    def _is_shown(overlay) -> bool:
+        """Visibility check that doesn't force an overlay into existence."""
+        return overlay is not None and overlay.isVisible()
+
+    def _qcolor(self, hex_str: str) -> QColor:
+        """Parse a color string once and reuse it (overlays copy before modifying)."""
+        color = self._color_cache.get(hex_str)
+        if color is None:
+            color = self._color_cache[hex_str] = QColor(hex_str)
+        return color
+
+    def _overlay_colors(self, config: dict, default_accent: str):
+        """Resolve (base, accent) for an overlay from the theme and the button's own color."""
+        colors = self.theme_manager.get_colors() if self.theme_manager else _EMPTY
+        base_color = self._qcolor(colors.get('base', '#2d2d2d'))
+        return base_color, self._qcolor(config.get('color') or colors.get('accent', default_accent))
+
+    def _local_rect(self, global_rect: QRect) -> QRect:
+        """Map a button's global rect into parent_widget coordinates."""
+        return QRect(self.parent_widget.mapFromGlobal(global_rect.topLeft()), global_rect.size())
+
+    @property
+    def dimmer_overlay(self):
+        if self._dimmer_overlay is None:
+            overlay = self._create_overlay(DimmerOverlay, self.on_dimmer_finished)
+            overlay.value_changed.connect(self.on_dimmer_value_changed)
+            self._dimmer_overlay = overlay
+        return self._dimmer_overlay
+
+    @property
+    def climate_overlay(self):
+        if self._climate_overlay is None:
+            overlay = self._create_overlay(ClimateOverlay, self.on_climate_finished)
+            overlay.value_changed.connect(self.on_climate_value_changed)
+            overlay.mode_changed.connect(self.on_climate_mode_changed)
+            overlay.fan_changed.connect(self.on_climate_fan_changed)
+            self._climate_overlay = overlay
+        return self._climate_overlay
+
+    @property
+    def printer_overlay(self):
+        if self._printer_overlay is None:
+            overlay = self._create_overlay(PrinterOverlay, self.on_printer_finished)
+            overlay.action_requested.connect(self.on_printer_action)
+            overlay.set_temperature_unit_preference(self._temperature_unit_preference)
+            self._printer_overlay = overlay
+        return self._printer_overlay
+
+    @property
+    def weather_overlay(self):
+        if self._weather_overlay is None:
+            overlay = self._create_overlay(WeatherOverlay, self.on_weather_finished)
+            overlay.set_temperature_unit_preference(self._temperature_unit_preference)
+            self._weather_overlay = overlay
+        return self._weather_overlay
+
+    @property
+    def camera_overlay(self):
+        if self._camera_overlay is None:
+            self._camera_overlay = self._create_overlay(CameraOverlay, self.on_camera_finished)
+        return self._camera_overlay
+
+    @property
+    def mower_overlay(self):
+        if self._mower_overlay is None:
+            overlay = self._create_overlay(MowerOverlay, self.on_mower_finished)
+            overlay.action_requested.connect(self.on_mower_action)
+            self._mower_overlay = overlay
+        return self._mower_overlay
+
+    @property
+    def vacuum_overlay(self):
+        if self._vacuum_overlay is None:
+            overlay = self._create_overlay(VacuumOverlay, self.on_vacuum_finished)
+            overlay.action_requested.connect(self.on_vacuum_action)
+            self._vacuum_overlay = overlay
+        return self._vacuum_overlay
 
-    def close_all_overlays(self):
-        """Instantly hide any active overlay. Called before navigating away from grid."""
-        if self.dimmer_overlay.isVisible():
-            self.dimmer_overlay.hide()
-            self.on_dimmer_finished()
-        if self.climate_overlay.isVisible():
-            self.climate_overlay.hide()
-            self.on_climate_finished()
-        if self.printer_overlay.isVisible():
-            self.printer_overlay.hide()
-            self.on_printer_finished()
-        if self.weather_overlay.isVisible():
-            self.weather_overlay.hide()
-            self.on_weather_finished()
     def any_overlay_open(self) -> bool:
         """Return True if any overlay is currently visible."""
-        return (self.dimmer_overlay.isVisible() or
-                self.climate_overlay.isVisible() or
-                self.printer_overlay.isVisible() or
-                self.weather_overlay.isVisible() or
-                self.camera_overlay.isVisible() or
-                self.mower_overlay.isVisible() or
-                self.vacuum_overlay.isVisible())
+        return (self._is_shown(self._dimmer_overlay) or
+                self._is_shown(self._climate_overlay) or
+                self._is_shown(self._printer_overlay) or
+                self._is_shown(self._weather_overlay) or
+                self._is_shown(self._camera_overlay) or
+                self._is_shown(self._mower_overlay) or
+                self._is_shown(self._vacuum_overlay))
 
     def close_all_overlays_animated(self):
         """Trigger close_morph on all visible overlays instead of instant hide."""
-        if self.dimmer_overlay.isVisible() and not getattr(self.dimmer_overlay, '_is_closing', False):
+        if self._is_shown(self._dimmer_overlay) and not getattr(self.dimmer_overlay, '_is_closing', False):
             self.dimmer_overlay.close_morph()
-        if self.climate_overlay.isVisible() and not getattr(self.climate_overlay, '_is_closing', False):
+        if self._is_shown(self._climate_overlay) and not getattr(self.climate_overlay, '_is_closing', False):
             self.climate_overlay.close_morph()
-        if self.printer_overlay.isVisible() and not getattr(self.printer_overlay, '_is_closing', False):
+        if self._is_shown(self._printer_overlay) and not getattr(self.printer_overlay, '_is_closing', False):
             self.printer_overlay.close_morph()
-        if self.weather_overlay.isVisible() and not getattr(self.weather_overlay, '_is_closing', False):
+        if self._is_shown(self._weather_overlay) and not getattr(self.weather_overlay, '_is_closing', False):
             self.weather_overlay.close_morph()
-        if self.camera_overlay.isVisible() and not getattr(self.camera_overlay, '_is_closing', False):
+        if self._is_shown(self._camera_overlay) and not getattr(self.camera_overlay, '_is_closing', False):
             self.camera_overlay.close_morph()
-        if self.mower_overlay.isVisible() and not getattr(self.mower_overlay, '_is_closing', False):
+        if self._is_shown(self._mower_overlay) and not getattr(self.mower_overlay, '_is_closing', False):
             self.mower_overlay.close_morph()
-        if self.vacuum_overlay.isVisible() and not getattr(self.vacuum_overlay, '_is_closing', False):
+        if self._is_shown(self._vacuum_overlay) and not getattr(self.vacuum_overlay, '_is_closing', False):
             self.vacuum_overlay.close_morph()
 
     def _queue_or_start_overlay(self, method, slot, *args):
@@ -157,17 +247,17 @@ class OverlayManager(QObject):
         """
         if self.any_overlay_open():
             active_btn = None
-            if self.dimmer_overlay.isVisible() and not getattr(self.dimmer_overlay, '_is_closing', False):
+            if self._is_shown(self._dimmer_overlay) and not getattr(self.dimmer_overlay, '_is_closing', False):
                 active_btn = self._dimmer_source_btn
-            elif self.climate_overlay.isVisible() and not getattr(self.climate_overlay, '_is_closing', False):
+            elif self._is_shown(self._climate_overlay) and not getattr(self.climate_overlay, '_is_closing', False):
                 active_btn = self._climate_source_btn
-            elif self.printer_overlay.isVisible() and not getattr(self.printer_overlay, '_is_closing', False):
+            elif self._is_shown(self._printer_overlay) and not getattr(self.printer_overlay, '_is_closing', False):
                 active_btn = self._printer_source_btn
-            elif self.weather_overlay.isVisible() and not getattr(self.weather_overlay, '_is_closing', False):
+            elif self._is_shown(self._weather_overlay) and not getattr(self.weather_overlay, '_is_closing', False):
                 active_btn = self._weather_source_btn
-            elif self.camera_overlay.isVisible() and not getattr(self.camera_overlay, '_is_closing', False):
+            elif self._is_shown(self._camera_overlay) and not getattr(self.camera_overlay, '_is_closing', False):
                 active_btn = self._camera_source_btn
-            elif self.mower_overlay.isVisible() and not getattr(self.mower_overlay, '_is_closing', False):
+            elif self._is_shown(self._mower_overlay) and not getattr(self.mower_overlay, '_is_closing', False):
                 active_btn = self._mower_source_btn
 
             if active_btn and active_btn.slot == slot:
@@ -189,25 +279,14 @@ class OverlayManager(QObject):
             action()
 
     def close_all_overlays(self):
-        """Instantly hide any active overlay. Called before navigating away from grid."""
-        if self.dimmer_overlay.isVisible():
-            self.dimmer_overlay.hide()
-            self.on_dimmer_finished()
-        if self.climate_overlay.isVisible():
-            self.climate_overlay.hide()
-            self.on_climate_finished()
-        if self.printer_overlay.isVisible():
-            self.printer_overlay.hide()
-            self.on_printer_finished()
-        if self.weather_overlay.isVisible():
-            self.weather_overlay.hide()
-            self.on_weather_finished()
-        if self.camera_overlay.isVisible():
-            self.camera_overlay.hide()
-            self.on_camera_finished()
-        if self.mower_overlay.isVisible():
-            self.mower_overlay.hide()
-            self.on_mower_finished()
+        """Instantly hide the active overlay. Called before navigating away from grid."""
+        name = self._active_overlay
+        if name is None:
+            return
+        overlay = getattr(self, f'_{name}_overlay')
+        if self._is_shown(overlay):
+            overlay.hide()
+            getattr(self, f'on_{name}_finished')()
 
     def update_buttons(self, buttons: list):
         """Update reference to buttons."""
@@ -220,43 +299,37 @@ class OverlayManager(QObject):
     def update_entity_state(self, entity_id: str, state: dict):
         """Update a single entity's state and notify active overlays."""
         self._entity_states[entity_id] = state
-        
+        if self._active_overlay is None:
+            return
+
         # Notify active printer overlay if any of its entities changed
-        if self.printer_overlay.isVisible() and self._active_printer_config:
-            cfg = self._active_printer_config
-            relevant_entities = [
-                cfg.get('printer_state_entity'),
-                cfg.get('printer_nozzle_entity'),
-                cfg.get('printer_nozzle_target_entity'),
-                cfg.get('printer_bed_entity'),
-                cfg.get('printer_bed_target_entity'),
-                cfg.get('printer_progress_entity')
-            ]
-            if entity_id in relevant_entities:
-                self._push_printer_state()
+        if entity_id in self._active_printer_relevant and self._is_shown(self._printer_overlay):
+            # Coalesce bursts of printer updates into one push
+            if not self.printer_timer.isActive():
+                self.printer_timer.start()
                 
         # Notify active climate overlay
-        if self.climate_overlay.isVisible() and self._active_climate_entity == entity_id:
+        if self._is_shown(self._climate_overlay) and self._active_climate_entity == entity_id:
             self.climate_overlay.update_state(state)
             
         # Notify active weather overlay
-        if self.weather_overlay.isVisible() and self._active_weather_entity == entity_id:
+        if self._is_shown(self._weather_overlay) and self._active_weather_entity == entity_id:
             self.weather_overlay.update_state(state)
 
         # Notify active mower overlay
-        if self.mower_overlay.isVisible() and self._active_mower_entity == entity_id:
+        if self._is_shown(self._mower_overlay) and self._active_mower_entity == entity_id:
             self.mower_overlay.update_state(state)
 
         # Notify active vacuum overlay
-        if self.vacuum_overlay.isVisible() and self._active_vacuum_entity == entity_id:
+        if self._is_shown(self._vacuum_overlay) and self._active_vacuum_entity == entity_id:
             self.vacuum_overlay.update_state(state)
 
     def update_camera_image(self, entity_id: str, pixmap):
         """Update active overlays with new camera image."""
-        if self.printer_overlay.isVisible() and self._active_printer_config:
+        if self._is_shown(self._printer_overlay) and self._active_printer_config:
             if self._active_printer_config.get('printer_camera_entity') == entity_id:
                 self.printer_overlay.set_camera_pixmap(pixmap)
-        if self.camera_overlay.isVisible() and self._active_camera_entity == entity_id:
+        if self._is_shown(self._camera_overlay) and self._active_camera_entity == entity_id:
             self.camera_overlay.set_camera_pixmap(pixmap)
 
     def _push_printer_state(self):
@@ -265,71 +338,86 @@ class OverlayManager(QObject):
         
         cfg = self._active_printer_config
         
-        state_data = self._entity_states.get(cfg.get('printer_state_entity'), {})
+        # Skip rebuilding/pushing when none of the source entities changed
+        digest = tuple(
+            (data.get('state'), data.get('attributes'))
+            for data in (self._entity_states.get(cfg.get(key), _EMPTY) for key in PRINTER_ENTITY_KEYS)
+        )
+        if digest == self._last_printer_digest:
+            return self._last_printer_state
+        
+        state_data = self._entity_states.get(cfg.get('printer_state_entity'), _EMPTY)
         primary_state = state_data.get('state', 'unknown')
-        attrs = dict(state_data.get('attributes', {}))
+        attrs = dict(state_data.get('attributes') or _EMPTY)
         
         # Mix in Nozzle
-        noz_data = self._entity_states.get(cfg.get('printer_nozzle_entity'), {})
-        attrs['hotend_actual'] = noz_data.get('attributes', {}).get('actual_temperature', noz_data.get('state', 0.0))
-        noz_unit = noz_data.get('attributes', {}).get('unit_of_measurement')
+        noz_data = self._entity_states.get(cfg.get('printer_nozzle_entity'), _EMPTY)
+        noz_attrs = noz_data.get('attributes') or _EMPTY
+        attrs['hotend_actual'] = noz_attrs.get('actual_temperature', noz_data.get('state', 0.0))
+        noz_unit = noz_attrs.get('unit_of_measurement')
         if noz_unit:
             attrs['temperature_unit'] = noz_unit
         
         noz_target_ent = cfg.get('printer_nozzle_target_entity')
         if noz_target_ent:
-            noz_tgt_data = self._entity_states.get(noz_target_ent, {})
+            noz_tgt_data = self._entity_states.get(noz_target_ent, _EMPTY)
             try:
                 attrs['hotend_target'] = float(noz_tgt_data.get('state', 0.0))
             except (ValueError, TypeError):
                 attrs['hotend_target'] = 0.0
         else:
-            attrs['hotend_target'] = noz_data.get('attributes', {}).get('target_temperature', noz_data.get('attributes', {}).get('temperature', 0.0))
+            attrs['hotend_target'] = noz_attrs.get('target_temperature', noz_attrs.get('temperature', 0.0))
         
         # Mix in Bed
-        bed_data = self._entity_states.get(cfg.get('printer_bed_entity'), {})
-        attrs['bed_actual'] = bed_data.get('attributes', {}).get('actual_temperature', bed_data.get('state', 0.0))
+        bed_data = self._entity_states.get(cfg.get('printer_bed_entity'), _EMPTY)
+        bed_attrs = bed_data.get('attributes') or _EMPTY
+        attrs['bed_actual'] = bed_attrs.get('actual_temperature', bed_data.get('state', 0.0))
         
         bed_target_ent = cfg.get('printer_bed_target_entity')
         if bed_target_ent:
-            bed_tgt_data = self._entity_states.get(bed_target_ent, {})
+            bed_tgt_data = self._entity_states.get(bed_target_ent, _EMPTY)
             try:
                 attrs['bed_target'] = float(bed_tgt_data.get('state', 0.0))
             except (ValueError, TypeError):
                 attrs['bed_target'] = 0.0
         else:
-            attrs['bed_target'] = bed_data.get('attributes', {}).get('target_temperature', bed_data.get('attributes', {}).get('temperature', 0.0))
+            attrs['bed_target'] = bed_attrs.get('target_temperature', bed_attrs.get('temperature', 0.0))
         
         # Ensure progress is there
         prog_ent = cfg.get('printer_progress_entity')
         if prog_ent:
-            prog_val = self._entity_states.get(prog_ent, {}).get('state', 0.0)
+            prog_val = self._entity_states.get(prog_ent, _EMPTY).get('state', 0.0)
             try:
                 attrs['progress'] = float(prog_val)
             except (ValueError, TypeError):
                 attrs['progress'] = 0.0
-        elif 'progress' not in attrs:
-            attrs['progress'] = attrs.get('job_percentage', 0.0)
+        else:
+            attrs.setdefault('progress', attrs.get('job_percentage', 0.0))
             
         virtual_state = {
             'state': primary_state,
             'attributes': attrs
         }
         self.printer_overlay.update_state(virtual_state)
+        self._last_printer_digest = digest
+        self._last_printer_state = virtual_state
         return virtual_state
         
     def set_border_effect(self, effect: str):
         self._border_effect = effect
-        self.dimmer_overlay.set_border_effect(effect)
-        self.climate_overlay.set_border_effect(effect)
-        self.printer_overlay.set_border_effect(effect)
-        self.weather_overlay.set_border_effect(effect)
-        self.mower_overlay.set_border_effect(effect)
+        # Overlays not built yet pick the effect up in _create_overlay(), built ones
+        # are kept in sync here so start_* doesn't have to re-apply it on every open
+        for overlay in (self._dimmer_overlay, self._climate_overlay, self._printer_overlay,
+                        self._weather_overlay, self._camera_overlay, self._mower_overlay,
+                        self._vacuum_overlay):
+            if overlay is not None:
+                overlay.set_border_effect(effect)
 
     def set_temperature_unit_preference(self, preference: str):
         self._temperature_unit_preference = preference
-        self.weather_overlay.set_temperature_unit_preference(preference)
-        self.printer_overlay.set_temperature_unit_preference(preference)
+        for overlay in (self._weather_overlay, self._printer_overlay):
+            if overlay is not None:
+                overlay.set_temperature_unit_preference(preference)
 
     # ==========================
     # Dimmer / Volume Logic
@@ -349,7 +437,7 @@ class OverlayManager(QObject):
         self._active_dimmer_type = config.get('type', 'switch')
         
         # Calculate Start Value
-        source_btn = next((b for b in self.buttons if b.slot == slot), None)
+        source_btn = self._button_at(slot)
         current_val = 0
         
         state_obj = self._entity_states.get(entity_id, {})
@@ -369,30 +457,19 @@ class OverlayManager(QObject):
                 current_val = 100 if source_btn._state == "on" else 0
         
         # Colors
-        if self.theme_manager:
-            base_color = QColor(self.theme_manager.get_colors().get('base', '#2d2d2d'))
-        else:
-            base_color = QColor("#2d2d2d")
-        button_color = config.get('color')
-        accent_color = QColor(button_color) if button_color else QColor("#FFD700")
-        
-        if self.theme_manager and not button_color:
-            cols = self.theme_manager.get_colors()
-            accent_color = QColor(cols.get('accent', '#FFD700'))
+        base_color, accent_color = self._overlay_colors(config, '#FFD700')
             
         # Geometries
-        start_rect = self.parent_widget.mapFromGlobal(global_rect.topLeft())
-        start_rect = QRect(start_rect, global_rect.size())
+        start_rect = self._local_rect(global_rect)
         
-        target_rect = self._calculate_target_rect_and_siblings(source_btn, slot, overlay_type='dimmer')
+        target_rect, _ = self._calculate_target_rect_and_siblings(source_btn, slot, overlay_type='dimmer')
         
         # Start
-        self.dimmer_overlay.set_border_effect(self._border_effect)
-        
         label = config.get('label', 'Dimmer')
         # If type is media_player (via Volume), label usually passed differently or inferred?
         # Standard dimmer uses config label.
         
+        self._active_overlay = 'dimmer'
         self.dimmer_overlay.start_morph(
             start_rect, target_rect, current_val, label,
             color=accent_color, base_color=base_color
@@ -408,7 +485,7 @@ class OverlayManager(QObject):
         entity_id = config.get('entity_id')
         if not entity_id: return
         
-        source_btn = next((b for b in self.buttons if b.slot == slot), None)
+        source_btn = self._button_at(slot)
         if not source_btn: return
         
         # Get volume
@@ -421,45 +498,44 @@ class OverlayManager(QObject):
         self._final_dimmer_val = None
         
         # Geometries
-        local_rect = self.parent_widget.mapFromGlobal(global_rect.topLeft())
-        start_rect = QRect(local_rect, global_rect.size())
+        start_rect = self._local_rect(global_rect)
         
-        target_rect = self._calculate_target_rect_and_siblings(source_btn, slot, overlay_type='dimmer')
+        target_rect, _ = self._calculate_target_rect_and_siblings(source_btn, slot, overlay_type='dimmer')
         
         # Color
         accent = config.get('color')
-        color = QColor(accent) if accent else QColor("#4285F4")
+        color = self._qcolor(accent or "#4285F4")
+        base_color, _ = self._overlay_colors(config, '#4285F4')
         
-        self.dimmer_overlay.set_border_effect(self._border_effect)
+        self._active_overlay = 'dimmer'
         self.dimmer_overlay.start_morph(
             start_rect, target_rect, start_pct, "Volume",
-            color=color, base_color=QColor(self.theme_manager.get_colors().get('base', '#2d2d2d')) if self.theme_manager else QColor("#2d2d2d")
+            color=color, base_color=base_color
         )
         if not self.dimmer_timer.isActive():
             self.dimmer_timer.start()
 
     def _calculate_target_rect_and_siblings(self, source_btn, slot, overlay_type='dimmer'):
-        """Shared logic to find row siblings and target rect."""
-        if not source_btn: return QRect()
+        """Shared logic to find row siblings and target rect.
+        
+        Returns (target_rect, visible_rects) where visible_rects is the list from
+        _visible_button_rects(), so callers can reuse it instead of mapping again.
+        """
+        if not source_btn: return QRect(), []
         
-        src_pos = source_btn.mapTo(self.parent_widget, QPoint(0, 0))
+        parent_widget = self.parent_widget
+        src_pos = source_btn.mapTo(parent_widget, QPoint(0, 0))
         src_top = src_pos.y()
-        src_bottom = src_pos.y() + source_btn.height()
+        src_bottom = src_top + source_btn.height()
         
-        siblings = []
-        row_buttons = []
+        visible_rects = self._visible_button_rects()
+        self._invalidate_sibling_cache() # New sibling set - next morph frame must rebuild
         
-        for btn in self.buttons:
-            if not btn.isVisible(): continue
-            btn_pos = btn.mapTo(self.parent_widget, QPoint(0, 0))
-            btn_top = btn_pos.y()
-            btn_bottom = btn_pos.y() + btn.height()
-            
-            # Vertical overlap = same row
-            if btn_top < src_bottom and btn_bottom > src_top:
-                row_buttons.append((btn, btn_pos))
-                if btn != source_btn:
-                    siblings.append(btn)
+        # Vertical overlap = same row
+        row_buttons = [
+            (btn, btn_rect) for btn, btn_rect in visible_rects
+            if btn_rect.top() < src_bottom and btn_rect.top() + btn_rect.height() > src_top
+        ]
         
         # Store source button, but defer sibling assignment until after Rect calculation
         if overlay_type == 'climate':
@@ -494,37 +570,33 @@ class OverlayManager(QObject):
         # Calculate Rect
         if row_buttons:
             row_buttons.sort(key=lambda x: x[1].x())
-            first_btn, first_pos = row_buttons[0]
-            last_btn, last_pos = row_buttons[-1]
+            first_btn, first_rect = row_buttons[0]
+            last_btn, last_rect = row_buttons[-1]
             
-            target_x = first_pos.x()
-            target_width = (last_pos.x() + last_btn.width()) - first_pos.x()
+            target_x = first_rect.x()
+            target_width = (last_rect.x() + last_rect.width()) - first_rect.x()
             
             # Enforce Max Width of 6 Columns
-            # Better to use constants: (6 * BUTTON_WIDTH) + (5 * BUTTON_SPACING)
-            from ui.constants import BUTTON_WIDTH, BUTTON_SPACING
-            max_6_col_width = (6 * BUTTON_WIDTH) + (5 * BUTTON_SPACING)
-            
-            if target_width > max_6_col_width:
+            if target_width > MAX_OVERLAY_WIDTH:
                 # If we need to clamp, decide alignment based on source button position
                 # Center of source button relative to the full row width
-                row_width = (last_pos.x() + last_btn.width()) - first_pos.x()
+                row_width = (last_rect.x() + last_rect.width()) - first_rect.x()
                 src_center = src_pos.x() + (source_btn.width() / 2)
-                row_center = first_pos.x() + (row_width / 2)
+                row_center = first_rect.x() + (row_width / 2)
                 
                 # If source is in the right half, align right-to-left
                 if src_center > row_center:
                     # Align Right: keep the right edge fixed
                     right_edge = target_x + target_width 
-                    target_width = max_6_col_width
+                    target_width = MAX_OVERLAY_WIDTH
                     target_x = right_edge - target_width
                 else:
                      # Align Left (Default): keep left edge fixed
-                     target_width = max_6_col_width
+                     target_width = MAX_OVERLAY_WIDTH
             
             # Clamp width (fix for 3/4 col grid issue)
             # This is a safety check against window bounds
-            max_w = self.parent_widget.width()
+            max_w = parent_widget.width()
             if target_x + target_width > max_w:
                 target_width = max_w - target_x
             if target_x < 0:
@@ -536,12 +608,9 @@ class OverlayManager(QObject):
             # We collected row_buttons purely for geometry calculation earlier.
             # Now we decide who gets faded.
             filtered_siblings = []
-            for btn, btn_pos in row_buttons:
+            for btn, btn_rect in row_buttons:
                 if btn == source_btn: continue
                 
-                # Create button rect relative to parent
-                btn_rect = QRect(btn_pos, btn.size())
-                
                 # If the overlay covers (intersects) this button, it should fade
                 # We use a slight margin intersection to be safe
                 if final_rect.intersects(btn_rect):
@@ -560,16 +629,27 @@ class OverlayManager(QObject):
                 self._camera_siblings = filtered_siblings
             elif overlay_type == 'mower':
                 self._mower_siblings = filtered_siblings
+            elif overlay_type == 'vacuum':
+                self._vacuum_siblings = filtered_siblings
             else:
                 self._dimmer_siblings = filtered_siblings
                 
-            return final_rect
+            return final_rect, visible_rects
         else:
-            return QRect(src_pos, source_btn.size())
+            return QRect(src_pos, source_btn.size()), visible_rects
 
+    def _visible_button_rects(self):
+        """Map every visible button to parent coordinates once: [(button, QRect)]."""
+        parent = self.parent_widget
+        origin = QPoint(0, 0)
+        return [(btn, QRect(btn.mapTo(parent, origin), btn.size()))
+                for btn in self.buttons if btn.isVisible()]
+
+    @pyqtSlot(int)
     def on_dimmer_value_changed(self, value):
         self._pending_dimmer_val = value
 
+    @pyqtSlot()
     def process_pending_dimmer(self):
         if self._pending_dimmer_val is None or not self._active_dimmer_entity:
             return
@@ -578,9 +658,7 @@ class OverlayManager(QObject):
         self._pending_dimmer_val = None
         self._final_dimmer_val = val
         
-        dimmer_type = getattr(self, '_active_dimmer_type', 'switch')
-        
-        if dimmer_type in ['curtain', 'media_player']:
+        if self._active_dimmer_type in ('curtain', 'media_player'):
             # Send only on release
             return
             
@@ -595,11 +673,12 @@ class OverlayManager(QObject):
             "skip_debounce": True
         })
 
+    @pyqtSlot()
     def on_dimmer_finished(self):
         self.dimmer_timer.stop()
         
-        final_val = getattr(self, '_final_dimmer_val', None)
-        dimmer_type = getattr(self, '_active_dimmer_type', 'switch')
+        final_val = self._final_dimmer_val
+        dimmer_type = self._active_dimmer_type
         entity_id = self._active_dimmer_entity
         
         if final_val is not None and entity_id:
@@ -636,14 +715,10 @@ class OverlayManager(QObject):
         self._final_dimmer_val = None
         
         # Restore siblings
-        for btn in self._dimmer_siblings:
-            btn.set_opacity(1.0)
+        self._restore_buttons(self._dimmer_siblings, self._dimmer_source_btn)
         self._dimmer_siblings = []
-        
-        if self._dimmer_source_btn:
-            self._dimmer_source_btn.set_opacity(1.0)
-            self._dimmer_source_btn = None
-            
+        self._dimmer_source_btn = None
+        self._active_overlay = None
         self._check_pending_actions()
 
     # ==========================
@@ -660,30 +735,20 @@ class OverlayManager(QObject):
         
         self._active_climate_entity = entity_id
         
-        source_btn = next((b for b in self.buttons if b.slot == slot), None)
+        source_btn = self._button_at(slot)
         curr_temp = 20.0
         if source_btn and hasattr(source_btn, '_value'):
              try:
-                 temp_str = str(source_btn._value).replace('°', '').strip()
-                 curr_temp = float(temp_str)
-             except: pass
+                 curr_temp = float(str(source_btn._value).translate(_TEMP_UNIT_STRIP).strip())
+             except (ValueError, TypeError):
+                 pass
              
         # Colors
-        if self.theme_manager:
-            base_color = QColor(self.theme_manager.get_colors().get('base', '#2d2d2d'))
-        else:
-            base_color = QColor("#2d2d2d")
-        button_color = config.get('color')
-        accent_color = QColor(button_color) if button_color else QColor("#EA4335")
-        
-        if self.theme_manager and not button_color:
-            cols = self.theme_manager.get_colors()
-            accent_color = QColor(cols.get('accent', '#EA4335'))
+        base_color, accent_color = self._overlay_colors(config, '#EA4335')
             
-        start_rect = self.parent_widget.mapFromGlobal(global_rect.topLeft())
-        start_rect = QRect(start_rect, global_rect.size())
+        start_rect = self._local_rect(global_rect)
         
-        target_rect = self._calculate_target_rect_and_siblings(source_btn, slot, overlay_type='climate')
+        target_rect, visible_rects = self._calculate_target_rect_and_siblings(source_btn, slot, overlay_type='climate')
         
         # Enforce Minimum Height (2 Rows) for Climate Overlay
         min_height = (BUTTON_HEIGHT * 2) + BUTTON_SPACING
@@ -707,12 +772,10 @@ class OverlayManager(QObject):
                      target_rect.moveTop(target_rect.top() - diff)
 
             # Identify additional buttons covered by the expanded/moved rect
-            for btn in self.buttons:
-                if not btn.isVisible() or btn == source_btn: continue
+            for btn, btn_rect in visible_rects:
+                if btn == source_btn: continue
                 if btn in self._climate_siblings: continue
 
-                btn_pos = btn.mapTo(self.parent_widget, QPoint(0, 0))
-                btn_rect = QRect(btn_pos, btn.size())
                 
                 # Check for intersection with the new target geometry
                 if target_rect.intersects(btn_rect):
@@ -742,7 +805,7 @@ class OverlayManager(QObject):
             normalize_temperature_unit(display_unit),
         )
         
-        self.climate_overlay.set_border_effect(self._border_effect)
+        self._active_overlay = 'climate'
         self.climate_overlay.start_morph(
             start_rect, target_rect, curr_temp, config.get('label', 'Climate'),
             color=accent_color, base_color=base_color,
@@ -750,9 +813,11 @@ class OverlayManager(QObject):
         )
         self.climate_timer.start()
 
+    @pyqtSlot(float)
     def on_climate_value_changed(self, value):
         self._pending_climate_val = value
 
+    @pyqtSlot()
     def process_pending_climate(self):
         if self._pending_climate_val is None or not self._active_climate_entity:
             return
@@ -773,6 +838,7 @@ class OverlayManager(QObject):
             "service_data": {"temperature": service_temp}
         })
 
+    @pyqtSlot(str)
     def on_climate_mode_changed(self, mode):
         if self._active_climate_entity:
             self.service_request.emit({
@@ -781,6 +847,7 @@ class OverlayManager(QObject):
                 "service_data": {"hvac_mode": mode}
             })
 
+    @pyqtSlot(str)
     def on_climate_fan_changed(self, mode):
         if self._active_climate_entity:
              self.service_request.emit({
@@ -789,41 +856,61 @@ class OverlayManager(QObject):
                 "service_data": {"fan_mode": mode}
             })
 
+    @pyqtSlot()
     def on_climate_finished(self):
         self.climate_timer.stop()
         self._pending_climate_val = None
         self._active_climate_entity = None
         
-        for btn in self._climate_siblings:
-            btn.set_opacity(1.0)
+        self._restore_buttons(self._climate_siblings, self._climate_source_btn)
         self._climate_siblings = []
-        
-        if self._climate_source_btn:
-            self._climate_source_btn.set_opacity(1.0)
-            self._climate_source_btn = None
+        self._climate_source_btn = None
             
         self.parent_widget.activateWindow()
+        self._active_overlay = None
         self._check_pending_actions()
 
     # ==========================
     # Shared
     # ==========================
     
+    def _invalidate_sibling_cache(self):
+        """Forget per-frame sibling state after siblings are reassigned or restored."""
+        self._last_sibling_opacity = None
+        self._sibling_effects = None
+
+    def _restore_buttons(self, siblings, source_btn):
+        """Bring faded siblings and the overlay's source button back to full opacity."""
+        for btn in siblings:
+            btn.set_opacity(1.0)
+        if source_btn:
+            source_btn.set_opacity(1.0)
+        self._invalidate_sibling_cache()
+
+    def _collect_sibling_effects(self):
+        """Enable and gather the opacity effect of every sibling the active overlay fades."""
+        if self._active_overlay is None:
+            return []
+        # Only one overlay runs at a time, so its own sibling list is the whole set
+        effects = [btn._opacity_eff for btn in getattr(self, f'_{self._active_overlay}_siblings')]
+        for effect in effects:
+            effect.setEnabled(True)
+        return effects
+
+    @pyqtSlot(float)
     def on_morph_changed(self, progress: float):
         """Update sibling opacity."""
         opacity = 1.0 - (progress * 0.8) # Results in 0.2 final opacity
-        for btn in self._dimmer_siblings:
-            btn.set_opacity(opacity)
-        for btn in self._climate_siblings:
-            btn.set_opacity(opacity)
-        for btn in self._printer_siblings:
-            btn.set_opacity(opacity)
-        for btn in self._weather_siblings:
-            btn.set_opacity(opacity)
-        for btn in self._camera_siblings:
-            btn.set_opacity(opacity)
-        for btn in self._mower_siblings:
-            btn.set_opacity(opacity)
+        # Only touch the effects when the opacity moves by a visible 1/64 step
+        # (always apply the exact end values so fades land precisely)
+        opacity_step = round(opacity * 64)
+        if opacity_step != self._last_sibling_opacity or progress in (0.0, 1.0):
+            self._last_sibling_opacity = opacity_step
+            if self._sibling_effects is None:
+                self._sibling_effects = self._collect_sibling_effects()
+            # Drive the buttons' opacity effects directly; set_opacity(1.0) on finish disables them again
+            for effect in self._sibling_effects:
+                effect.setOpacity(opacity)
 
         # Fade source button back in during close (overlay fades out, button fades in)
         source_opacity = 1.0 - progress  # 0→1 as progress goes 1→0
@@ -856,8 +943,10 @@ class OverlayManager(QObject):
         
         self._active_printer_entity = entity_id
         self._active_printer_config = config
+        self._active_printer_relevant = frozenset(filter(None, (config.get(key) for key in PRINTER_ENTITY_KEYS)))
+        self._last_printer_digest = None
         
-        source_btn = next((b for b in self.buttons if b.slot == slot), None)
+        source_btn = self._button_at(slot)
         self._printer_source_btn = source_btn
         
         # Prepare initial data
@@ -867,25 +956,14 @@ class OverlayManager(QObject):
             self.printer_overlay.set_camera_pixmap(source_btn._last_camera_pixmap)
         
         # Colors
-        if self.theme_manager:
-            base_color = QColor(self.theme_manager.get_colors().get('base', '#2d2d2d'))
-        else:
-            base_color = QColor("#2d2d2d")
-        button_color = config.get('color')
-        accent_color = QColor(button_color) if button_color else QColor("#FF6D00")
-        
-        if self.theme_manager and not button_color:
-            cols = self.theme_manager.get_colors()
-            accent_color = QColor(cols.get('accent', '#FF6D00'))
+        base_color, accent_color = self._overlay_colors(config, '#FF6D00')
             
-        start_rect = self.parent_widget.mapFromGlobal(global_rect.topLeft())
-        start_rect = QRect(start_rect, global_rect.size())
+        start_rect = self._local_rect(global_rect)
         
         # Use existing shared logic but with 'printer' overlay_type
-        target_rect = self._calculate_target_rect_and_siblings(source_btn, slot, overlay_type='printer')
+        target_rect, visible_rects = self._calculate_target_rect_and_siblings(source_btn, slot, overlay_type='printer')
         
         # We want the printer overlay to be as big as possible (at least 2x4 usually)
-        from ui.constants import BUTTON_HEIGHT, BUTTON_SPACING, BUTTON_WIDTH
         min_height = (BUTTON_HEIGHT * 2) + BUTTON_SPACING
         if target_rect.height() < min_height:
             target_rect.setHeight(min_height)
@@ -900,11 +978,9 @@ class OverlayManager(QObject):
                      diff = target_rect.bottom() - safe_bottom
                      target_rect.moveTop(target_rect.top() - diff)
 
-            for btn in self.buttons:
-                if not btn.isVisible() or btn == source_btn: continue
+            for btn, btn_rect in visible_rects:
+                if btn == source_btn: continue
                 if btn in self._printer_siblings: continue
-                btn_pos = btn.mapTo(self.parent_widget, QPoint(0, 0))
-                btn_rect = QRect(btn_pos, btn.size())
                 if target_rect.intersects(btn_rect):
                     self._printer_siblings.append(btn)
                     btn.set_opacity(0.0)
@@ -912,41 +988,38 @@ class OverlayManager(QObject):
         # Consolidate entities into a virtual state for the printer overlay
         virtual_state = self._push_printer_state()
         
-        self.printer_overlay.set_border_effect(self._border_effect)
+        self._active_overlay = 'printer'
         self.printer_overlay.start_morph(
             start_rect, target_rect, config.get('label', '3D Printer'),
             color=accent_color, base_color=base_color,
             current_state=virtual_state
         )
 
+    @pyqtSlot(str)
     def on_printer_action(self, action: str):
         if not self._active_printer_config: return
         
-        if action in ('pause', 'resume'):
-            entity = self._active_printer_config.get('printer_pause_entity')
-            if entity:
-                self.service_request.emit({
-                    "service": "button.press",
-                    "entity_id": entity
-                })
-        elif action == 'stop':
-            entity = self._active_printer_config.get('printer_stop_entity')
-            if entity:
-                self.service_request.emit({
-                    "service": "button.press",
-                    "entity_id": entity
-                })
+        key = _PRINTER_ACTION_KEYS.get(action)
+        entity = self._active_printer_config.get(key) if key else None
+        if entity:
+            self.service_request.emit({
+                "service": "button.press",
+                "entity_id": entity
+            })
 
+    @pyqtSlot()
     def on_printer_finished(self):
+        self.printer_timer.stop()
         self._active_printer_entity = None
         self._active_printer_config = None
-        for btn in self._printer_siblings:
-            btn.set_opacity(1.0)
+        self._active_printer_relevant = frozenset()
+        self._last_printer_digest = None
+        self._last_printer_state = None
+        self._restore_buttons(self._printer_siblings, self._printer_source_btn)
         self._printer_siblings = []
-        if self._printer_source_btn:
-            self._printer_source_btn.set_opacity(1.0)
-            self._printer_source_btn = None
+        self._printer_source_btn = None
         self.parent_widget.activateWindow()
+        self._active_overlay = None
         self._check_pending_actions()
 
     # ==========================
@@ -957,7 +1030,7 @@ class OverlayManager(QObject):
         if self._queue_or_start_overlay(self.start_mower, slot, global_rect):
             return
 
-        source_btn = next((b for b in self.buttons if b.slot == slot), None)
+        source_btn = self._button_at(slot)
         if not source_btn or not source_btn.config:
             return
         config = source_btn.config
@@ -968,19 +1041,11 @@ class OverlayManager(QObject):
         self._active_mower_entity = entity_id
 
         # Colors
-        if self.theme_manager:
-            base_color = QColor(self.theme_manager.get_colors().get('base', '#2d2d2d'))
-        else:
-            base_color = QColor("#2d2d2d")
-        button_color = config.get('color')
-        accent_color = QColor(button_color) if button_color else QColor("#4CAF50")
-        if self.theme_manager and not button_color:
-            accent_color = QColor(self.theme_manager.get_colors().get('accent', '#4CAF50'))
+        base_color, accent_color = self._overlay_colors(config, '#4CAF50')
 
-        start_rect = self.parent_widget.mapFromGlobal(global_rect.topLeft())
-        start_rect = QRect(start_rect, global_rect.size())
+        start_rect = self._local_rect(global_rect)
 
-        target_rect = self._calculate_target_rect_and_siblings(source_btn, slot, overlay_type='mower')
+        target_rect, visible_rects = self._calculate_target_rect_and_siblings(source_btn, slot, overlay_type='mower')
 
         # Enforce 2-row minimum height
         min_height = (BUTTON_HEIGHT * 2) + BUTTON_SPACING
@@ -997,26 +1062,25 @@ class OverlayManager(QObject):
                     diff = target_rect.bottom() - safe_bottom
                     target_rect.moveTop(target_rect.top() - diff)
 
-            for btn in self.buttons:
-                if not btn.isVisible() or btn == source_btn:
+            for btn, btn_rect in visible_rects:
+                if btn == source_btn:
                     continue
                 if btn in self._mower_siblings:
                     continue
-                btn_pos = btn.mapTo(self.parent_widget, QPoint(0, 0))
-                btn_rect = QRect(btn_pos, btn.size())
                 if target_rect.intersects(btn_rect):
                     self._mower_siblings.append(btn)
                     btn.set_opacity(0.0)
 
         current_state = self._entity_states.get(entity_id, {})
 
-        self.mower_overlay.set_border_effect(self._border_effect)
+        self._active_overlay = 'mower'
         self.mower_overlay.start_morph(
             start_rect, target_rect, config.get('label', 'Mower'),
             color=accent_color, base_color=base_color,
             current_state=current_state
         )
 
+    @pyqtSlot(str)
     def on_mower_action(self, action: str):
         if not self._active_mower_entity:
             return
@@ -1025,15 +1089,14 @@ class OverlayManager(QObject):
             "entity_id": self._active_mower_entity
         })
 
+    @pyqtSlot()
     def on_mower_finished(self):
         self._active_mower_entity = None
-        for btn in self._mower_siblings:
-            btn.set_opacity(1.0)
+        self._restore_buttons(self._mower_siblings, self._mower_source_btn)
         self._mower_siblings = []
-        if self._mower_source_btn:
-            self._mower_source_btn.set_opacity(1.0)
-            self._mower_source_btn = None
+        self._mower_source_btn = None
         self.parent_widget.activateWindow()
+        self._active_overlay = None
         self._check_pending_actions()
 
     # ==========================
@@ -1044,7 +1107,7 @@ class OverlayManager(QObject):
         if self._queue_or_start_overlay(self.start_vacuum, slot, global_rect):
             return
 
-        source_btn = next((b for b in self.buttons if b.slot == slot), None)
+        source_btn = self._button_at(slot)
         if not source_btn or not source_btn.config:
             return
         config = source_btn.config
@@ -1055,19 +1118,11 @@ class OverlayManager(QObject):
         self._active_vacuum_entity = entity_id
 
         # Colors
-        if self.theme_manager:
-            base_color = QColor(self.theme_manager.get_colors().get('base', '#2d2d2d'))
-        else:
-            base_color = QColor("#2d2d2d")
-        button_color = config.get('color')
-        accent_color = QColor(button_color) if button_color else QColor("#4CAF50")
-        if self.theme_manager and not button_color:
-            accent_color = QColor(self.theme_manager.get_colors().get('accent', '#4CAF50'))
+        base_color, accent_color = self._overlay_colors(config, '#4CAF50')
 
-        start_rect = self.parent_widget.mapFromGlobal(global_rect.topLeft())
-        start_rect = QRect(start_rect, global_rect.size())
+        start_rect = self._local_rect(global_rect)
 
-        target_rect = self._calculate_target_rect_and_siblings(source_btn, slot, overlay_type='vacuum')
+        target_rect, visible_rects = self._calculate_target_rect_and_siblings(source_btn, slot, overlay_type='vacuum')
 
         # Enforce 2-row minimum height
         min_height = (BUTTON_HEIGHT * 2) + BUTTON_SPACING
@@ -1084,26 +1139,25 @@ class OverlayManager(QObject):
                     diff = target_rect.bottom() - safe_bottom
                     target_rect.moveTop(target_rect.top() - diff)
 
-            for btn in self.buttons:
-                if not btn.isVisible() or btn == source_btn:
+            for btn, btn_rect in visible_rects:
+                if btn == source_btn:
                     continue
                 if btn in self._vacuum_siblings:
                     continue
-                btn_pos = btn.mapTo(self.parent_widget, QPoint(0, 0))
-                btn_rect = QRect(btn_pos, btn.size())
                 if target_rect.intersects(btn_rect):
                     self._vacuum_siblings.append(btn)
                     btn.set_opacity(0.0)
 
         current_state = self._entity_states.get(entity_id, {})
 
-        self.vacuum_overlay.set_border_effect(self._border_effect)
+        self._active_overlay = 'vacuum'
         self.vacuum_overlay.start_morph(
             start_rect, target_rect, config.get('label', 'Vacuum'),
             color=accent_color, base_color=base_color,
             current_state=current_state
         )
 
+    @pyqtSlot(str)
     def on_vacuum_action(self, action: str):
         if not self._active_vacuum_entity:
             return
@@ -1112,15 +1166,14 @@ class OverlayManager(QObject):
             "entity_id": self._active_vacuum_entity
         })
 
+    @pyqtSlot()
     def on_vacuum_finished(self):
         self._active_vacuum_entity = None
-        for btn in self._vacuum_siblings:
-            btn.set_opacity(1.0)
+        self._restore_buttons(self._vacuum_siblings, self._vacuum_source_btn)
         self._vacuum_siblings = []
-        if self._vacuum_source_btn:
-            self._vacuum_source_btn.set_opacity(1.0)
-            self._vacuum_source_btn = None
+        self._vacuum_source_btn = None
         self.parent_widget.activateWindow()
+        self._active_overlay = None
         self._check_pending_actions()
 
     # ==========================
@@ -1136,23 +1189,13 @@ class OverlayManager(QObject):
         if not entity_id: return
         
         self._active_weather_entity = entity_id
-        source_btn = next((b for b in self.buttons if b.slot == slot), None)
-        
-        if self.theme_manager:
-            base_color = QColor(self.theme_manager.get_colors().get('base', '#2d2d2d'))
-        else:
-            base_color = QColor("#2d2d2d")
-        button_color = config.get('color')
-        accent_color = QColor(button_color) if button_color else QColor("#4285F4")
+        source_btn = self._button_at(slot)
         
-        if self.theme_manager and not button_color:
-            cols = self.theme_manager.get_colors()
-            accent_color = QColor(cols.get('accent', '#4285F4'))
+        base_color, accent_color = self._overlay_colors(config, '#4285F4')
             
-        start_rect = self.parent_widget.mapFromGlobal(global_rect.topLeft())
-        start_rect = QRect(start_rect, global_rect.size())
+        start_rect = self._local_rect(global_rect)
         
-        target_rect = self._calculate_target_rect_and_siblings(source_btn, slot, overlay_type='weather')
+        target_rect, visible_rects = self._calculate_target_rect_and_siblings(source_btn, slot, overlay_type='weather')
         
         # Enforce Minimum Height (2 Rows) for Weather Overlay
         min_height = (BUTTON_HEIGHT * 2) + BUTTON_SPACING
@@ -1170,32 +1213,29 @@ class OverlayManager(QObject):
                     target_rect.moveTop(target_rect.top() - diff)
 
             # Identify additional buttons covered by the expanded rect
-            for btn in self.buttons:
-                if not btn.isVisible() or btn == source_btn: continue
+            for btn, btn_rect in visible_rects:
+                if btn == source_btn: continue
                 if btn in self._weather_siblings: continue
-                btn_pos = btn.mapTo(self.parent_widget, QPoint(0, 0))
-                btn_rect = QRect(btn_pos, btn.size())
                 if target_rect.intersects(btn_rect):
                     self._weather_siblings.append(btn)
                     btn.set_opacity(0.0)
 
         current_state = self._entity_states.get(entity_id, {})
         
-        self.weather_overlay.set_border_effect(self._border_effect)
+        self._active_overlay = 'weather'
         self.weather_overlay.start_morph(
             start_rect, target_rect, current_state, forecasts, config.get('label', 'Weather'),
             color=accent_color, base_color=base_color
         )
 
+    @pyqtSlot()
     def on_weather_finished(self):
         self._active_weather_entity = None
-        for btn in self._weather_siblings:
-            btn.set_opacity(1.0)
+        self._restore_buttons(self._weather_siblings, self._weather_source_btn)
         self._weather_siblings = []
-        if self._weather_source_btn:
-            self._weather_source_btn.set_opacity(1.0)
-            self._weather_source_btn = None
+        self._weather_source_btn = None
         self.parent_widget.activateWindow()
+        self._active_overlay = None
         self._check_pending_actions()
 
     # ==========================
@@ -1212,34 +1252,25 @@ class OverlayManager(QObject):
         
         self._active_camera_entity = entity_id
         
-        source_btn = next((b for b in self.buttons if b.slot == slot), None)
+        source_btn = self._button_at(slot)
         self._camera_source_btn = source_btn
         
         if source_btn and hasattr(source_btn, '_last_camera_pixmap') and source_btn._last_camera_pixmap:
             self.camera_overlay.set_camera_pixmap(source_btn._last_camera_pixmap)
             
-        if self.theme_manager:
-            base_color = QColor(self.theme_manager.get_colors().get('base', '#2d2d2d'))
-        else:
-            base_color = QColor("#2d2d2d")
+        base_color, _ = self._overlay_colors(config, '#4285F4')
             
-        start_rect = self.parent_widget.mapFromGlobal(global_rect.topLeft())
-        start_rect = QRect(start_rect, global_rect.size())
-        
-        from ui.constants import BUTTON_HEIGHT, BUTTON_SPACING, BUTTON_WIDTH
+        start_rect = self._local_rect(global_rect)
         
         # Calculate max boundaries of the actual grid layout
-        visible_rects = []
-        for btn in self.buttons:
-            if btn.isVisible():
-                pos = btn.mapTo(self.parent_widget, QPoint(0, 0))
-                visible_rects.append(QRect(pos, btn.size()))
+        visible_rects = self._visible_button_rects()
+        self._invalidate_sibling_cache()
                 
         if visible_rects:
-            grid_min_x = min(r.left() for r in visible_rects)
-            grid_max_x = max(r.right() for r in visible_rects)
-            grid_min_y = min(r.top() for r in visible_rects)
-            grid_max_y = max(r.bottom() for r in visible_rects)
+            grid_min_x = min(r.left() for _, r in visible_rects)
+            grid_max_x = max(r.right() for _, r in visible_rects)
+            grid_min_y = min(r.top() for _, r in visible_rects)
+            grid_max_y = max(r.bottom() for _, r in visible_rects)
         else:
             # Fallback if no layout calculated
             grid_min_x = start_rect.left()
@@ -1277,30 +1308,26 @@ class OverlayManager(QObject):
 
         target_rect = QRect(target_x, target_y, target_w, target_h)
         
-        for btn in self.buttons:
-            if not btn.isVisible() or btn == source_btn: continue
+        for btn, btn_rect in visible_rects:
+            if btn == source_btn: continue
             if btn in self._camera_siblings: continue
-            btn_pos = btn.mapTo(self.parent_widget, QPoint(0, 0))
-            # Create a slight margin logic for intersection, or use the parent rect directly
-            btn_rect = QRect(btn_pos, btn.size())
             # Use small margins to avoid floating point or off-by-one pixel overlaps causing unintended fade
             if target_rect.intersects(btn_rect.adjusted(2, 2, -2, -2)):
                 self._camera_siblings.append(btn)
                 btn.set_opacity(0.0)
                 
-        self.camera_overlay.set_border_effect(self._border_effect)
         label = config.get('label', 'Camera')
+        self._active_overlay = 'camera'
         self.camera_overlay.start_morph(
             start_rect, target_rect, label, base_color=base_color
         )
 
+    @pyqtSlot()
     def on_camera_finished(self):
         self._active_camera_entity = None
-        for btn in self._camera_siblings:
-            btn.set_opacity(1.0)
+        self._restore_buttons(self._camera_siblings, self._camera_source_btn)
         self._camera_siblings = []
-        if self._camera_source_btn:
-            self._camera_source_btn.set_opacity(1.0)
-            self._camera_source_btn = None
+        self._camera_source_btn = None
         self.parent_widget.activateWindow()
+        self._active_overlay = None
         self._check_pending_actions()
@@ -1,6 +1,79 @@
 import typing
 from PyQt6.QtCore import Qt, QRect, QRectF
-from PyQt6.QtGui import QPainter, QPainterPath, QPixmap, QColor, QPen
+from PyQt6.QtGui import QPainter, QPainterPath, QPixmap, QColor, QPen, QImage
+
+def _average_luminance(pixmap: QPixmap) -> float:
+    """Rec. 709 luminance of the pixmap's mean color (0-255)."""
+    img = pixmap.toImage().convertToFormat(QImage.Format.Format_RGBA8888)
+    cnt = img.width() * img.height()
+    if cnt == 0:
+        return 0
+    # RGBA8888 rows are 4-byte aligned, so the bits are a flat R,G,B,A sequence
+    ptr = img.constBits()
+    ptr.setsize(img.sizeInBytes())
+    buf = bytes(ptr)
+    return (0.2126 * sum(buf[0::4]) + 0.7152 * sum(buf[1::4]) + 0.0722 * sum(buf[2::4])) / cnt
+
+
+# (pixmap cacheKey, crop rect) -> (blur, text, tint, border); insertion-ordered for FIFO eviction
+_FROST_CACHE = {}
+_FROST_CACHE_SIZE = 32
+
+
+def _frosted_slice(background_pixmap: QPixmap, valid_src: QRect):
+    """Blurred crop and contrast colors for a pill, memoized per source pixmap and crop.
+
+    Album art and camera frames change a few times a minute at most while the
+    pill is repainted with every animation frame, so the blur and luminance
+    work only runs when the source or the pill geometry changes.
+    """
+    key = (background_pixmap.cacheKey(), valid_src.x(), valid_src.y(), valid_src.width(), valid_src.height())
+    frost = _FROST_CACHE.get(key)
+    if frost is not None:
+        return frost
+    
+    pill_w = valid_src.width()
+    pill_h = valid_src.height()
+    bg_crop = background_pixmap.copy(valid_src)
+    if bg_crop.isNull():
+        return None
+    
+    # Blur Simulation: Downscale -> Upscale
+    # A tiny scale factor creates heavy optical blur when blown back up
+    sm = bg_crop.scaled(
+        max(1, int(pill_w * 0.1)), 
+        max(1, int(pill_h * 0.1)), 
+        Qt.AspectRatioMode.IgnoreAspectRatio, 
+        Qt.TransformationMode.SmoothTransformation
+    )
+    blur = sm.scaled(
+        pill_w, 
+        pill_h, 
+        Qt.AspectRatioMode.IgnoreAspectRatio, 
+        Qt.TransformationMode.SmoothTransformation
+    )
+    
+    # Fast Luminance Check
+    avg_lum = _average_luminance(sm)
+    
+    # Determine contrasting colors based on brightness
+    if avg_lum > 128:
+        # Background is LIGHT -> Use dark text/icons
+        text_color = QColor(0, 0, 0, 220)
+        bg_tint_color = QColor(255, 255, 255, 60) # Boost brightness slightly
+        border_color = QColor(0, 0, 0, 30)
+    else:
+        # Background is DARK -> Use light text/icons
+        text_color = QColor(255, 255, 255, 240)
+        bg_tint_color = QColor(0, 0, 0, 60)       # Dim slightly
+        border_color = QColor(255, 255, 255, 50)
+    
+    frost = (blur, text_color, bg_tint_color, border_color)
+    if len(_FROST_CACHE) >= _FROST_CACHE_SIZE:
+        del _FROST_CACHE[next(iter(_FROST_CACHE))]
+    _FROST_CACHE[key] = frost
+    return frost
+
 
 def draw_frosted_pill(
     painter: QPainter, 
@@ -42,49 +115,11 @@ def draw_frosted_pill(
         pill_h = int(pill_rect.height())
         
         valid_src = QRect(int(pill_src_x), int(pill_src_y), pill_w, pill_h)
-        bg_crop = background_pixmap.copy(valid_src)
+        frost = _frosted_slice(background_pixmap, valid_src)
         
-        if not bg_crop.isNull():
-            # Blur Simulation: Downscale -> Upscale
-            # A tiny scale factor creates heavy optical blur when blown back up
-            sm = bg_crop.scaled(
-                max(1, int(pill_w * 0.1)), 
-                max(1, int(pill_h * 0.1)), 
-                Qt.AspectRatioMode.IgnoreAspectRatio, 
-                Qt.TransformationMode.SmoothTransformation
-            )
-            blur = sm.scaled(
-                pill_w, 
-                pill_h, 
-                Qt.AspectRatioMode.IgnoreAspectRatio, 
-                Qt.TransformationMode.SmoothTransformation
-            )
-            
-            # Fast Luminance Check
-            img = sm.toImage()
-            rs = gs = bs = cnt = 0
-            for sy in range(img.height()):
-                for sx in range(img.width()):
-                    pc = img.pixelColor(sx, sy)
-                    rs += pc.red()
-                    gs += pc.green()
-                    bs += pc.blue()
-                    cnt += 1
-                    
-            avg_lum = (0.2126 * (rs/cnt) + 0.7152 * (gs/cnt) + 0.0722 * (bs/cnt)) if cnt > 0 else 0
+        if frost:
+            blur, text_color, bg_tint_color, border_color = frost
             
-            # Determine contrasting colors based on brightness
-            if avg_lum > 128:
-                # Background is LIGHT -> Use dark text/icons
-                text_color = QColor(0, 0, 0, 220)
-                bg_tint_color = QColor(255, 255, 255, 60) # Boost brightness slightly
-                border_color = QColor(0, 0, 0, 30)
-            else:
-                # Background is DARK -> Use light text/icons
-                text_color = QColor(255, 255, 255, 240)
-                bg_tint_color = QColor(0, 0, 0, 60)       # Dim slightly
-                border_color = QColor(255, 255, 255, 50)
-                
             # Render frosted glass slice
             painter.save()
             painter.setClipPath(pill_path)
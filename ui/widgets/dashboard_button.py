@@ -4,7 +4,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import (
     Qt, QPoint, QPointF, pyqtSignal, QPropertyAnimation, QEasingCurve, 
-    QMimeData, QByteArray, QDataStream, QIODevice, pyqtProperty, QRectF, QTimer, QRect,
+    QMimeData, QByteArray, pyqtProperty, QRectF, QTimer, QRect,
     pyqtSlot, QUrl, QSize
 )
 from PyQt6.QtGui import (
@@ -14,15 +14,101 @@ from PyQt6.QtGui import (
 )
 from ui.icons import get_icon, get_mdi_font, Icons, get_icon_for_type
 from core.utils import SYSTEM_FONT
+from ui.constants import BUTTON_WIDTH, BUTTON_HEIGHT, BUTTON_SPACING
 from core.temperature_utils import format_temperature, is_temperature_entity
 from ui.widgets.dashboard_button_painter import DashboardButtonPainter
 from ui.widgets.dashboard_button_styles import DashboardButtonStyleManager
+from ui.visuals.background_generator import BackgroundGenerator
 import math
+import re
+import struct
 import sys
+import time
+from functools import lru_cache
 
 # Custom MIME type for drag and drop
 MIME_TYPE = "application/x-hatray-slot"
 
+# Leading number and trailing unit of a sensor value ("21.456°C" -> "21.456", "°C")
+_NUMBER_UNIT_RE = re.compile(r"([+-]?\d*\.?\d+)(.*)")
+
+_IS_LINUX = sys.platform.startswith('linux')
+
+# HA weather state -> MDI icon (Linux) / emoji (other platforms)
+_WEATHER_MDI_ICONS = {
+    'clear-night': Icons.WEATHER_NIGHT,
+    'cloudy': Icons.WEATHER_CLOUDY,
+    'fog': Icons.WEATHER_FOG,
+    'hail': Icons.WEATHER_HAIL,
+    'lightning': Icons.WEATHER_LIGHTNING,
+    'lightning-rainy': Icons.WEATHER_LIGHTNING_RAINY,
+    'partlycloudy': Icons.WEATHER_PARTLY_CLOUDY,
+    'pouring': Icons.WEATHER_POURING,
+    'rainy': Icons.WEATHER_RAINY,
+    'snowy': Icons.WEATHER_SNOWY,
+    'snowy-rainy': Icons.WEATHER_SNOWY_RAINY,
+    'sunny': Icons.WEATHER_SUNNY,
+    'windy': Icons.WEATHER_WINDY,
+    'windy-variant': Icons.WEATHER_WINDY_VARIANT,
+    'exceptional': Icons.ALERT_CIRCLE
+}
+
+_WEATHER_EMOJI = {
+    'clear-night': '🌙',
+    'cloudy': '☁️',
+    'fog': '🌫️',
+    'hail': '🌨️',
+    'lightning': '🌩️',
+    'lightning-rainy': '⛈️',
+    'partlycloudy': '⛅',
+    'pouring': '🌧️',
+    'rainy': '🌧️',
+    'snowy': '❄️',
+    'snowy-rainy': '🌨️',
+    'sunny': '☀️',
+    'windy': '💨',
+    'windy-variant': '🌬️',
+    'exceptional': '⚠️'
+}
+
+# Right-click menu style, applied once per button
+_CONTEXT_MENU_QSS = """
+    QMenu {
+        background-color: #2b2b2b;
+        border: 1px solid #3d3d3d;
+        border-radius: 6px;
+        padding: 4px;
+    }
+    QMenu::item {
+        background: transparent;
+        padding: 6px 24px 6px 12px;
+        color: #e0e0e0;
+        border-radius: 4px;
+    }
+    QMenu::item:selected {
+        background-color: #007aff;
+        color: white;
+    }
+"""
+
+@lru_cache(maxsize=None)
+def _system_font(size: int, weight=-1) -> QFont:
+    """Shared label font. setFont() copies it, so the result must never be modified."""
+    return QFont(SYSTEM_FONT, size, weight)
+
+
+@lru_cache(maxsize=None)
+def _mdi_font(size: int = 24) -> QFont:
+    """Shared MDI icon font, same rules as _system_font()."""
+    return get_mdi_font(size)
+
+
+@lru_cache(maxsize=1)
+def _drag_distance() -> int:
+    """Platform drag threshold, resolved once the QApplication exists."""
+    return QApplication.startDragDistance()
+
+
 class DashboardButton(QFrame):
     """Button or widget in the grid."""
     
@@ -53,6 +139,10 @@ class DashboardButton(QFrame):
         self.span_y = self.config.get('span_y', 1)
         
         self.theme_manager = theme_manager
+        self._accent_qcolor = QColor('#0078d4')  # Theme accent, refreshed on theme change
+        if theme_manager:
+            theme_manager.theme_changed.connect(self._on_theme_changed)
+            self._on_theme_changed()
         self._show_border_effect = False
         self._show_dimming = False
         self._brightness = 255
@@ -67,6 +157,7 @@ class DashboardButton(QFrame):
         self._drag_start_pos = None
         self._is_resizing = False
         self._resize_start_span = (1, 1)
+        self._requested_span = (1, 1)  # Last span sent via resize_requested
         
         # input_number interaction state
         self._input_changing = False
@@ -86,6 +177,9 @@ class DashboardButton(QFrame):
         self.resize_anim = QPropertyAnimation(self, b"resize_handle_opacity")
         self.resize_anim.setDuration(200) # Fast fade
         self.resize_anim.setEasingCurve(QEasingCurve.Type.InOutQuad)
+        self._handle_hover = None  # Last applied handle hover state (None = not yet synced)
+        self._context_menu = None  # Built on first right-click
+        self._update_handle_corner()
         
         # Input number blink animation
         self._input_blink_opacity = 0.0
@@ -107,6 +201,8 @@ class DashboardButton(QFrame):
         self.anim = QPropertyAnimation(self, b"anim_progress")
         self.anim.setDuration(1500) # Slower, more elegant
         self.anim.setEasingCurve(QEasingCurve.Type.InOutQuad)
+        self.anim.setStartValue(0.0)
+        self.anim.setEndValue(1.0)
         
         # Script pulse animation
         self._pulse_opacity = 0.0
@@ -138,6 +234,10 @@ class DashboardButton(QFrame):
         self._anim_bg_cache_key = None
         self._anim_bg_anchors = None
         self._anim_bg_tiny = None  # Cached tiny QPixmap (reused every frame)
+        self._applied_qss = None  # Last stylesheet set by DashboardButtonStyleManager
+        self._polished_type = None  # "type" property value at the last re-polish
+        self._content_pending = False  # update_content() queued by an HA state setter
+        self._style_pending = False  # update_style() queued alongside it
 
         self.setup_ui()
         self.update_style()
@@ -196,7 +296,9 @@ class DashboardButton(QFrame):
         
     def set_resize_handle_opacity(self, val):
         self._resize_handle_opacity = val
-        self.update() 
+        # Only the bottom-right handle wedge changes during the fade
+        size = DashboardButtonPainter.RESIZE_HANDLE_SIZE + 4
+        self.update(QRect(self.width() - size, self.height() - size, size, size))
         
     resize_handle_opacity = pyqtProperty(float, get_resize_handle_opacity, set_resize_handle_opacity)
     
@@ -238,18 +340,24 @@ class DashboardButton(QFrame):
 
     show_dimming = pyqtProperty(bool, get_show_dimming, set_show_dimming)
 
+    @staticmethod
+    def _span_size(x, y) -> QSize:
+        """Fixed size of a button spanning x columns and y rows, spacing included."""
+        return QSize(BUTTON_WIDTH * x + BUTTON_SPACING * (x - 1),
+                     BUTTON_HEIGHT * y + BUTTON_SPACING * (y - 1))
+
     def set_spans(self, x, y):
         """Update spans and resize widget."""
         self.span_x = x
         self.span_y = y
-        # Calculate new size based on grid units (90x80) + spacing (8)
-        w = 90 * x + (8 * (x - 1))
-        h = 80 * y + (8 * (y - 1))
-        self.setFixedSize(w, h)
-        
-        # Re-apply camera image to fit new size immediately
-        if self._last_camera_pixmap and not self._last_camera_pixmap.isNull():
-             self.set_camera_image(self._last_camera_pixmap)
+        size = self._span_size(x, y)
+        # set_buttons() re-applies spans on every rebuild, usually unchanged - skip the relayout then
+        if size != self.minimumSize() or size != self.maximumSize():
+            self.setFixedSize(size)
+            
+            # Re-apply camera image to fit new size immediately
+            if self._last_camera_pixmap and not self._last_camera_pixmap.isNull():
+                 self.set_camera_image(self._last_camera_pixmap)
              
         # Force content update to adapt layout (1x1 -> 2x1 etc)
         self.update_content()
@@ -257,10 +365,15 @@ class DashboardButton(QFrame):
 
     def trigger_feedback(self):
         """Start the feedback animation."""
-        self.anim.stop()
-        self.anim.setStartValue(0.0)
-        self.anim.setEndValue(1.0)
-        self.anim.start()
+        self._restart_anim(self.anim)
+
+    @staticmethod
+    def _restart_anim(anim):
+        """Restart a fixed-range animation, rewinding it in place if already running."""
+        if anim.state() == QPropertyAnimation.State.Running:
+            anim.setCurrentTime(0)
+        else:
+            anim.start()
     
     def setup_ui(self):
         """Setup the button UI."""
@@ -306,13 +419,16 @@ class DashboardButton(QFrame):
         layout.addStretch()
         
 
-        self.setFixedSize(90 * self.span_x + (8 * (self.span_x - 1)), 80 * self.span_y + (8 * (self.span_y - 1)))
+        self.setFixedSize(self._span_size(self.span_x, self.span_y))
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         
         self.update_content()
     
     def update_content(self):
         """Update button content from config."""
+        # Buttonless hover moves only drive the resize handle, which needs an entity
+        self.setMouseTracking(bool(self.config and self.config.get('entity_id')))
+        
         if not self.config:
             self._update_empty_view()
             return
@@ -325,41 +441,36 @@ class DashboardButton(QFrame):
         btn_type = self.config.get('type', 'switch')
         
         # Dispatch to specific view updaters
-        if btn_type == 'weather':
-            self._update_weather_view()
-        elif btn_type == 'widget':
-            self._update_widget_view()
-        elif btn_type == 'climate':
-            self._update_climate_view()
-        elif btn_type == 'curtain':
-            self._update_curtain_view()
-        elif btn_type == 'script':
-            self._update_script_view()
-        elif btn_type == 'automation':
-            self._update_automation_view()
-        elif btn_type == 'scene':
-            self._update_scene_view()
-        elif btn_type == 'fan':
-            self._update_fan_view()
-        elif btn_type == 'media_player':
-            self._update_media_player_view()
-        elif btn_type == 'camera':
-            self._update_camera_view()
-        elif btn_type == '3d_printer':
-            self._update_3d_printer_view()
-        elif btn_type == 'lawn_mower':
-            self._update_lawn_mower_view()
-        elif btn_type == 'vacuum':
-            self._update_vacuum_view()
-        elif btn_type == 'input_number':
-            self._update_input_number_view()
+        updater = _VIEW_UPDATERS.get(btn_type)
+        if updater:
+            updater(self)
         else:
             self._update_default_view(btn_type)
             
-        self.style().unpolish(self)
-        self.style().polish(self)
+        self._apply_type(btn_type)
         self._update_anim_bg_timer()
 
+    def _apply_type(self, btn_type: str):
+        """Set the QSS type property, re-polishing only when it actually changes.
+
+        The label rules are descendant selectors on the type, so the labels are
+        re-polished here too - polishing the button alone doesn't reach them.
+        """
+        if btn_type != self._polished_type:
+            self._polished_type = btn_type
+            self.setProperty("type", btn_type)
+            style = self.style()
+            for widget in (self, self.value_label, self.name_label):
+                style.unpolish(widget)
+                style.polish(widget)
+            # The sheet text doesn't depend on type, so force the next update_style() to re-set it
+            self._applied_qss = None
+
+    def _on_theme_changed(self, theme: str = None):
+        """Re-resolve theme-derived colors used while painting."""
+        accent = self.theme_manager.get_colors().get('accent', '#0078d4')
+        self._accent_qcolor = QColor(accent)
+
     def set_temperature_unit_preference(self, preference: str):
         if self.temperature_unit_preference != preference:
             self.temperature_unit_preference = preference
@@ -388,7 +499,6 @@ class DashboardButton(QFrame):
         cache_key = (seed, self.width(), self.height())
         if self._anim_bg_cache_key == cache_key and self._anim_bg_layers is not None:
             return
-        from ui.visuals.background_generator import BackgroundGenerator
         self._anim_bg_layers = BackgroundGenerator.generate_layers(
             self.width(), self.height(), seed=seed
         )
@@ -397,7 +507,6 @@ class DashboardButton(QFrame):
         scale = 0.15
         tw = max(20, int(self.width() * scale))
         th = max(16, int(self.height() * scale))
-        from PyQt6.QtGui import QPixmap
         self._anim_bg_tiny = QPixmap(tw, th)
         self._anim_bg_cache_key = cache_key
         self._anim_bg_frame = 0
@@ -413,12 +522,23 @@ class DashboardButton(QFrame):
     def resizeEvent(self, event):
         super().resizeEvent(event)
         self._anim_bg_cache_key = None  # force regen on next paint
+        self._update_handle_corner()
+
+    def _update_handle_corner(self):
+        """Cache the top-left of the resize handle hit area for the current size."""
+        size = DashboardButtonPainter.RESIZE_HANDLE_SIZE
+        self._corner_x_min = self.width() - size
+        self._corner_y_min = self.height() - size
+
+    def _in_handle(self, pos) -> bool:
+        """Whether a local position falls inside the resize handle corner."""
+        return pos.x() >= self._corner_x_min and pos.y() >= self._corner_y_min
 
     # --- View Helpers ---
 
     def _update_empty_view(self):
         """Show add button."""
-        self.value_label.setFont(get_mdi_font(24))
+        self.value_label.setFont(_mdi_font(24))
         self.value_label.setText(Icons.PLUS)
         self.name_label.setText("Add")
         self.value_label.show()
@@ -429,7 +549,7 @@ class DashboardButton(QFrame):
 
     def _update_forbidden_view(self):
         """Show forbidden icon."""
-        self.value_label.setFont(get_mdi_font(22))
+        self.value_label.setFont(_mdi_font(22))
         self.value_label.setText(get_icon("block-helper"))
         self.name_label.hide()
         self.value_label.show()
@@ -459,7 +579,7 @@ class DashboardButton(QFrame):
         
         # On Linux, we use MDI icons which need to be in a specific font family
         # We wrap them in a span with the correct font family
-        is_linux = sys.platform.startswith('linux')
+        is_linux = _IS_LINUX
         
         if is_huge:
             humidity = attrs.get('humidity', '--')
@@ -471,7 +591,7 @@ class DashboardButton(QFrame):
                 wind_display = f"{wind} m/s"
 
             # Use different font size/styling for MDI vs Emoji
-            mdi_family = get_mdi_font().family()
+            mdi_family = _mdi_font().family()
             emoji_html = f"<span style='font-family: \"{mdi_family}\"; font-size: 40px;'>{emoji}</span>" if is_linux else f"{emoji}"
 
             text = (
@@ -481,30 +601,30 @@ class DashboardButton(QFrame):
             )
             self.value_label.setTextFormat(Qt.TextFormat.RichText)
             self.value_label.setText(text)
-            self.value_label.setFont(QFont(SYSTEM_FONT, 12)) 
+            self.value_label.setFont(_system_font(12)) 
         elif is_tall and not is_wide:
             self.value_label.setTextFormat(Qt.TextFormat.RichText if is_linux else Qt.TextFormat.PlainText)
             if is_linux:
-                mdi_family = get_mdi_font().family()
+                mdi_family = _mdi_font().family()
                 emoji_html = f"<div style='font-family: \"{mdi_family}\"; font-size: 40px; margin-bottom: 5px;'>{emoji}</div>"
                 self.value_label.setText(f"{emoji_html}{temp_str}")
             else:
                 self.value_label.setText(f"{emoji}\n{temp_str}")
-            self.value_label.setFont(QFont(SYSTEM_FONT, 24))
+            self.value_label.setFont(_system_font(24))
         elif is_wide:
             self.value_label.setTextFormat(Qt.TextFormat.RichText if is_linux else Qt.TextFormat.PlainText)
             if is_linux:
-                mdi_family = get_mdi_font().family()
+                mdi_family = _mdi_font().family()
                 emoji_html = f"<span style='font-family: \"{mdi_family}\"; font-size: 32px;'>{emoji}</span>"
                 self.value_label.setText(f"{emoji_html} {temp_str}")
             else:
                 self.value_label.setText(f"{emoji} {temp_str}")
-            self.value_label.setFont(QFont(SYSTEM_FONT, 28))
+            self.value_label.setFont(_system_font(28))
         else:
             self.value_label.setTextFormat(Qt.TextFormat.PlainText)
             # Small buttons: just temp
             self.value_label.setText(temp_str)
-            self.value_label.setFont(QFont(SYSTEM_FONT, 22, QFont.Weight.Bold))
+            self.value_label.setFont(_system_font(22, QFont.Weight.Bold))
         
         if label:
             self.name_label.setText(label)
@@ -512,20 +632,18 @@ class DashboardButton(QFrame):
         else:
             self.name_label.hide()
             
-        self.setProperty("type", "weather")
         self.value_label.show()
 
     def _update_widget_view(self):
         """Update generic sensor widget."""
         label = self.config.get('label', '')
-        self.value_label.setFont(QFont(SYSTEM_FONT, 16, QFont.Weight.Bold))
+        self.value_label.setFont(_system_font(16, QFont.Weight.Bold))
         
         val = self._value
         if val is not None:
             precision = self.config.get('precision', 1)
             try:
-                import re
-                match = re.match(r"([+-]?\d*\.?\d+)(.*)", str(val))
+                match = _NUMBER_UNIT_RE.match(str(val))
                 if match:
                     num_str, unit_str = match.groups()
                     f_val = float(num_str)
@@ -539,14 +657,13 @@ class DashboardButton(QFrame):
                     
         self.value_label.setText(val or "--")
         self.name_label.setText(label)
-        self.setProperty("type", "widget")
         self.value_label.show()
         self.name_label.show()
 
     def _update_input_number_view(self):
         """Update view for input_number entities."""
         label = self.config.get('label', '')
-        self.value_label.setFont(QFont(SYSTEM_FONT, 18, QFont.Weight.Bold))
+        self.value_label.setFont(_system_font(18, QFont.Weight.Bold))
         
         state_obj = self._value if isinstance(self._value, dict) else {}
         val = state_obj.get('state', '--')
@@ -572,22 +689,20 @@ class DashboardButton(QFrame):
             
         self.value_label.setText(display_val)
         self.name_label.setText(label)
-        self.setProperty("type", "input_number")
         self.value_label.show()
         self.name_label.show()
 
     def _update_climate_view(self):
         label = self.config.get('label', '')
-        self.value_label.setFont(QFont(SYSTEM_FONT, 16, QFont.Weight.Bold))
+        self.value_label.setFont(_system_font(16, QFont.Weight.Bold))
         self.value_label.setText(self._value or "--")
         self.name_label.setText(label)
-        self.setProperty("type", "climate")
         self.value_label.show()
         self.name_label.show()
 
     def _update_curtain_view(self):
         label = self.config.get('label', '')
-        self.value_label.setFont(get_mdi_font(26))
+        self.value_label.setFont(_mdi_font(26))
         
         icon_name = self.config.get('icon') or self._ha_icon
         icon_char = get_icon(icon_name) if icon_name else None
@@ -599,88 +714,81 @@ class DashboardButton(QFrame):
             
         self.value_label.setText(icon)
         self.name_label.setText(label)
-        self.setProperty("type", "curtain")
         self.value_label.show()
         self.name_label.show()
 
     def _update_script_view(self):
-        self._update_simple_icon_view(Icons.SCRIPT, "script")
+        self._update_simple_icon_view(Icons.SCRIPT)
 
     def _update_automation_view(self):
-        self._update_simple_icon_view(Icons.AUTOMATION, "automation")
+        self._update_simple_icon_view(Icons.AUTOMATION)
 
     def _update_scene_view(self):
-        self._update_simple_icon_view(Icons.SCENE_THEME, "scene")
+        self._update_simple_icon_view(Icons.SCENE_THEME)
 
     def _update_fan_view(self):
-         self._update_simple_icon_view(Icons.FAN, "fan")
+         self._update_simple_icon_view(Icons.FAN)
 
-    def _update_simple_icon_view(self, default_icon, type_name):
+    def _update_simple_icon_view(self, default_icon):
         """Helper for simple icon+label buttons."""
         label = self.config.get('label', '')
-        self.value_label.setFont(get_mdi_font(26))
+        self.value_label.setFont(_mdi_font(26))
         
         icon_name = self.config.get('icon') or self._ha_icon
         icon_char = get_icon(icon_name) if icon_name else None
         
         self.value_label.setText(icon_char if icon_char else default_icon)
         self.name_label.setText(label)
-        self.setProperty("type", type_name)
         self.value_label.show()
         self.name_label.show()
 
     def _update_media_player_view(self):
         self.value_label.hide()
         self.name_label.hide()
-        self.setProperty("type", "media_player")
         self.update()
 
     def _update_camera_view(self):
         self.value_label.hide()
         self.name_label.hide()
-        self.setProperty("type", "camera")
         
         if not self._cached_display_pixmap or self._cached_display_pixmap.isNull():
             self.value_label.show()
-            self.value_label.setFont(get_mdi_font(26))
+            self.value_label.setFont(_mdi_font(26))
             self.value_label.setText(Icons.VIDEO)
 
     def _update_3d_printer_view(self):
         self.value_label.hide()
         self.name_label.hide()
-        self.setProperty("type", "3d_printer")
         self.update()
         if not self._cached_display_pixmap or self._cached_display_pixmap.isNull():
             self.value_label.show()
-            self.value_label.setFont(get_mdi_font(26))
+            self.value_label.setFont(_mdi_font(26))
             self.value_label.setText(Icons.VIDEO)
 
     def _update_lawn_mower_view(self):
         """Update lawn mower widget — sensor-style with state text + label."""
         label = self.config.get('label', '')
-        self.value_label.setFont(QFont(SYSTEM_FONT, 16, QFont.Weight.Bold))
+        self.value_label.setFont(_system_font(16, QFont.Weight.Bold))
         state_str = self._state or 'unknown'
         self.value_label.setText(state_str.replace('_', ' ').capitalize())
         self.name_label.setText(label)
-        self.setProperty("type", "lawn_mower")
         self.value_label.show()
         self.name_label.show()
 
     def _update_vacuum_view(self):
         """Update vacuum widget — sensor-style with state text + label."""
         label = self.config.get('label', '')
-        self.value_label.setFont(QFont(SYSTEM_FONT, 16, QFont.Weight.Bold))
+        self.value_label.setFont(_system_font(16, QFont.Weight.Bold))
         state_str = self._state or 'unknown'
         self.value_label.setText(state_str.replace('_', ' ').capitalize())
         self.name_label.setText(label)
-        self.setProperty("type", "vacuum")
         self.value_label.show()
         self.name_label.show()
 
     def _update_default_view(self, btn_type):
         """Default view for switch, light, lock, etc."""
         label = self.config.get('label', '')
-        self.value_label.setFont(get_mdi_font(26))
+        self.value_label.setFont(_mdi_font(26))
         
         icon_name = self.config.get('icon') or self._ha_icon
         icon_char = get_icon(icon_name) if icon_name else None
@@ -692,21 +800,41 @@ class DashboardButton(QFrame):
             
         self.value_label.setText(icon)
         self.name_label.setText(label)
-        self.setProperty("type", btn_type) 
         self.value_label.show()
         self.name_label.show()
     
     def set_state(self, state: str):
         """Set the state (on/off) for switches."""
+        if state == self._state:
+            return
         self._state = state
-        self.update_content()
-        self.update_style()
+        self._schedule_refresh(style=True)
     
     def set_value(self, value):
         """Update button value (sensor reading, etc)."""
         if self._value != value:
             self._value = value
-            self.update_content()
+            self._schedule_refresh()
+
+    def _schedule_refresh(self, style: bool = False):
+        """Queue one content (and optionally style) refresh for the next event loop pass.
+
+        A single HA state push can hit several setters (icon, state, value);
+        this collapses them into one update_content() call.
+        """
+        self._style_pending = self._style_pending or style
+        if not self._content_pending:
+            self._content_pending = True
+            QTimer.singleShot(0, self._flush_refresh)
+
+    def _flush_refresh(self):
+        if not self._content_pending:
+            return
+        self._content_pending = False
+        self.update_content()
+        if self._style_pending:
+            self._style_pending = False
+            self.update_style()
 
     def set_ha_icon(self, icon_name: str):
         """Update the icon from Home Assistant state."""
@@ -714,7 +842,7 @@ class DashboardButton(QFrame):
             self._ha_icon = icon_name
             # Only update content if we are NOT using a custom icon
             if not self.config.get('icon'):
-                self.update_content()
+                self._schedule_refresh()
     
     def set_media_state(self, state: dict):
         """Set the full media player state."""
@@ -743,13 +871,6 @@ class DashboardButton(QFrame):
         self._album_art = pixmap
         self.update()  # Trigger repaint
 
-    def set_camera_image(self, pixmap):
-        """Set the camera image pixmap."""
-        self._last_camera_pixmap = pixmap
-        # If we are currently in camera mode, force update
-        if self.config.get('type') == 'camera':
-             self.update()
-
     def reset_state(self):
         """Reset internal state to default."""
         self._state = "off"
@@ -834,7 +955,7 @@ class DashboardButton(QFrame):
             self.set_weather_state(state)
         elif btn_type == 'input_number':
             self._value = state
-            self.update_content()
+            self._schedule_refresh()
         elif btn_type == 'media_player':
             # Media player gets full state
             self.set_media_state(state)
@@ -842,6 +963,8 @@ class DashboardButton(QFrame):
             # State entity logic (e.g. Printing, Paused)
             self.set_state(state.get('state', 'unknown'))
             # Let the painter pull the rest from the dashboard's _entity_states directly
+            # (repaint even when the state text is unchanged - the attributes may not be)
+            self.update()
         elif btn_type == 'lawn_mower':
             # Raw HA state drives both view text and ON-color styling
             self.set_state(state.get('state', 'unknown'))
@@ -862,54 +985,16 @@ class DashboardButton(QFrame):
 
     def set_weather_state(self, state_obj: dict):
         """Set full weather state object."""
+        if state_obj == self._value:
+            return
         self._value = state_obj
-        self.update_content()
-        self.update_style()
+        self._schedule_refresh(style=True)
 
     def _get_weather_emoji(self, state: str) -> str:
         """Map HA weather state to emoji (or MDI icon on Linux)."""
-        is_linux = sys.platform.startswith('linux')
-        
-        if is_linux:
-            # Map to MDI icons
-            mapping = {
-                'clear-night': Icons.WEATHER_NIGHT,
-                'cloudy': Icons.WEATHER_CLOUDY,
-                'fog': Icons.WEATHER_FOG,
-                'hail': Icons.WEATHER_HAIL,
-                'lightning': Icons.WEATHER_LIGHTNING,
-                'lightning-rainy': Icons.WEATHER_LIGHTNING_RAINY,
-                'partlycloudy': Icons.WEATHER_PARTLY_CLOUDY,
-                'pouring': Icons.WEATHER_POURING,
-                'rainy': Icons.WEATHER_RAINY,
-                'snowy': Icons.WEATHER_SNOWY,
-                'snowy-rainy': Icons.WEATHER_SNOWY_RAINY,
-                'sunny': Icons.WEATHER_SUNNY,
-                'windy': Icons.WEATHER_WINDY,
-                'windy-variant': Icons.WEATHER_WINDY_VARIANT,
-                'exceptional': Icons.ALERT_CIRCLE
-            }
-            return mapping.get(state, Icons.WEATHER_CLOUDY) # Default to cloudy/unknown
-        else:
-            # Simple mapping
-            mapping = {
-                'clear-night': '🌙',
-                'cloudy': '☁️',
-                'fog': '🌫️',
-                'hail': '🌨️',
-                'lightning': '🌩️',
-                'lightning-rainy': '⛈️',
-                'partlycloudy': '⛅',
-                'pouring': '🌧️',
-                'rainy': '🌧️',
-                'snowy': '❄️',
-                'snowy-rainy': '🌨️',
-                'sunny': '☀️',
-                'windy': '💨',
-                'windy-variant': '🌬️',
-                'exceptional': '⚠️'
-            }
-            return mapping.get(state, 'Unknown')
+        if _IS_LINUX:
+            return _WEATHER_MDI_ICONS.get(state, Icons.WEATHER_CLOUDY) # Default to cloudy/unknown
+        return _WEATHER_EMOJI.get(state, 'Unknown')
     
     def set_camera_image(self, pixmap):
         """Set camera image from QPixmap."""
@@ -1007,6 +1092,10 @@ class DashboardButton(QFrame):
         self._border_effect = effect
         self.update()
 
+    def _global_rect(self) -> QRect:
+        """Button geometry in screen coordinates (overlay morph source)."""
+        return QRect(self.mapToGlobal(QPoint(0, 0)), self.size())
+
     def _on_long_press(self):
         """Handle long press: Start dimmer, climate, or volume if applicable."""
         if not self.config: return
@@ -1021,8 +1110,7 @@ class DashboardButton(QFrame):
             self.bounce_anim.start()
         
         # Get absolute coordinates
-        global_pos = self.mapToGlobal(QPoint(0,0))
-        rect = QRect(global_pos, self.size())
+        rect = self._global_rect()
         
         if btn_type == 'switch':
             # Lights show dimmer overlay
@@ -1066,13 +1154,12 @@ class DashboardButton(QFrame):
             self._drag_start_pos = event.globalPosition().toPoint()
             
             # Check if clicking functionality (handle)
-            rect = self.rect()
-            size = 28
-            in_corner = (event.pos().x() >= rect.width() - size) and (event.pos().y() >= rect.height() - size)
+            in_corner = self._in_handle(event.pos())
             
             if in_corner and self._resize_handle_opacity > 0.0:
                 self._is_resizing = True
                 self._resize_start_span = (self.span_x, self.span_y)
+                self._requested_span = self._resize_start_span
                 # Don't trigger long press if resizing
             else:
                 self._is_resizing = False
@@ -1127,31 +1214,31 @@ class DashboardButton(QFrame):
                     self.bounce_anim.start()
         super().mousePressEvent(event)
 
+    def _set_handle_hover(self, active: bool):
+        """Fade the resize handle in/out and switch the cursor to match."""
+        self._handle_hover = active
+        target = 1.0 if active else 0.0
+        if self.resize_anim.endValue() != target:
+            self.resize_anim.stop()
+            self.resize_anim.setEndValue(target)
+            self.resize_anim.start()
+        if active:
+            self.setCursor(Qt.CursorShape.SizeFDiagCursor)
+        else:
+            self.unsetCursor() # Use unsetCursor to revert to parent/default instead of forcing Hand
+
     def mouseMoveEvent(self, event):
         """Handle drag start and hover effects."""
         # Check for resize handle hover (only for configured buttons, not Add buttons)
         is_configured = self.config and self.config.get('entity_id')
         
         if not self._drag_start_pos:
-            rect = self.rect()
-            size = 28 
-            in_corner = is_configured and (event.pos().x() >= rect.width() - size) and (event.pos().y() >= rect.height() - size)
+            in_corner = bool(is_configured) and self._in_handle(event.pos())
             
             # Simplified Logic: If in corner, fade in. If not, fade out.
-            # Only trigger if not already at target state or moving towards it.
-            
-            if in_corner:
-                 if self.resize_anim.endValue() != 1.0:
-                     self.resize_anim.stop()
-                     self.resize_anim.setEndValue(1.0)
-                     self.resize_anim.start()
-                 self.setCursor(Qt.CursorShape.SizeFDiagCursor)
-            else:
-                 if self.resize_anim.endValue() != 0.0:
-                     self.resize_anim.stop()
-                     self.resize_anim.setEndValue(0.0)
-                     self.resize_anim.start()
-                 self.unsetCursor() # Use unsetCursor to revert to parent/default instead of forcing Hand
+            # Only touch the animation and cursor when crossing the corner boundary.
+            if in_corner != self._handle_hover:
+                self._set_handle_hover(in_corner)
         
         if not (event.buttons() & Qt.MouseButton.LeftButton):
             return
@@ -1173,7 +1260,7 @@ class DashboardButton(QFrame):
             # Use whichever delta is larger
             delta = dy if abs(dy) > abs(dx) else dx
             
-            if not self._input_changing and max(abs(dx), abs(dy)) > QApplication.startDragDistance():
+            if not self._input_changing and max(abs(dx), abs(dy)) > _drag_distance():
                 self._input_changing = True
                 self._long_press_timer.stop()
                 
@@ -1223,12 +1310,16 @@ class DashboardButton(QFrame):
             max_y_allowed = 3 if self.config.get('type') == '3d_printer' else 2
             new_span_y = max(1, min(max_y_allowed, self._resize_start_span[1] + dy_steps))
             
-            if new_span_x != self.span_x or new_span_y != self.span_y:
+            # Emit once per new span - a clamped or blocked request would otherwise
+            # re-run the dashboard's relocation search on every mouse move
+            new_span = (new_span_x, new_span_y)
+            if new_span != self._requested_span:
+                self._requested_span = new_span
                 self.resize_requested.emit(self.slot, new_span_x, new_span_y)
             return
 
         dist = (event.globalPosition().toPoint() - self._drag_start_pos).manhattanLength()
-        if dist < QApplication.startDragDistance():
+        if dist < _drag_distance():
             return
             
         # Drag started -> Cancel long press
@@ -1242,16 +1333,12 @@ class DashboardButton(QFrame):
         drag = QDrag(self)
         mime_data = QMimeData()
         
-        data = QByteArray()
-        stream = QDataStream(data, QIODevice.OpenModeFlag.WriteOnly)
-        stream.writeInt32(self.slot)
-        mime_data.setData(MIME_TYPE, data)
+        # Big-endian int32 slot (same layout QDataStream.writeInt32 produced)
+        mime_data.setData(MIME_TYPE, QByteArray(struct.pack('>i', self.slot)))
         
         drag.setMimeData(mime_data)
         
         # Build ghost pixmap: button content clipped to rounded rect
-        from PyQt6.QtGui import QPainterPath
-
         ghost = QPixmap(self.size())
         ghost.fill(Qt.GlobalColor.transparent)
         gp = QPainter(ghost)
@@ -1272,13 +1359,12 @@ class DashboardButton(QFrame):
         drag.setHotSpot(event.pos())
 
         # Gradually fade the original button to 50% over 400 ms
-        import time as _time
-        _fade_start = _time.monotonic()
+        _fade_start = time.monotonic()
         _fade_duration = 0.4
         _fade_timer = QTimer(self)
 
         def _do_fade():
-            progress = min(1.0, (_time.monotonic() - _fade_start) / _fade_duration)
+            progress = min(1.0, (time.monotonic() - _fade_start) / _fade_duration)
             self.set_faded(1.0 - 0.5 * progress)
             self.repaint()
             if progress >= 1.0:
@@ -1334,9 +1420,10 @@ class DashboardButton(QFrame):
         if self._drag_start_pos and event.button() == Qt.MouseButton.LeftButton:
              if self.config:
                  self.trigger_feedback() # Show feedback BEFORE emit
+             btn_type = self.config.get('type') if self.config else None
              
              # Media Player Logic
-             if self.config and self.config.get('type') == 'media_player':
+             if btn_type == 'media_player':
                  x = event.pos().x()
                  y = event.pos().y()
                  w = self.width()
@@ -1385,36 +1472,29 @@ class DashboardButton(QFrame):
                  return
 
              # Script/Scene: Trigger pulse animation
-             if self.config and self.config.get('type') in ['script', 'scene']:
-                 self.pulse_anim.stop()
-                 self.pulse_anim.start()
+             if btn_type in ('script', 'scene'):
+                 self._restart_anim(self.pulse_anim)
              
              # Climate widgets open overlay on normal click
-             if self.config and self.config.get('type') == 'climate':
-                 global_pos = self.mapToGlobal(QPoint(0,0))
-                 rect = QRect(global_pos, self.size())
+             if btn_type == 'climate':
+                 rect = self._global_rect()
                  self.climate_requested.emit(self.slot, rect)
-             elif self.config and self.config.get('type') == 'weather':
-                 global_pos = self.mapToGlobal(QPoint(0,0))
-                 rect = QRect(global_pos, self.size())
+             elif btn_type == 'weather':
+                 rect = self._global_rect()
                  self.weather_requested.emit(self.slot, rect)
-             elif self.config and self.config.get('type') == 'camera':
-                 global_pos = self.mapToGlobal(QPoint(0,0))
-                 rect = QRect(global_pos, self.size())
+             elif btn_type == 'camera':
+                 rect = self._global_rect()
                  self.camera_requested.emit(self.slot, rect, self.config)
-             elif self.config and self.config.get('type') == '3d_printer':
-                 global_pos = self.mapToGlobal(QPoint(0,0))
-                 rect = QRect(global_pos, self.size())
+             elif btn_type == '3d_printer':
+                 rect = self._global_rect()
                  self.printer_requested.emit(self.slot, rect, self.config)
-             elif self.config and self.config.get('type') == 'lawn_mower':
-                 global_pos = self.mapToGlobal(QPoint(0,0))
-                 rect = QRect(global_pos, self.size())
+             elif btn_type == 'lawn_mower':
+                 rect = self._global_rect()
                  self.mower_requested.emit(self.slot, rect)
-             elif self.config and self.config.get('type') == 'vacuum':
-                 global_pos = self.mapToGlobal(QPoint(0,0))
-                 rect = QRect(global_pos, self.size())
+             elif btn_type == 'vacuum':
+                 rect = self._global_rect()
                  self.vacuum_requested.emit(self.slot, rect)
-             elif self.config and self.config.get('type') == 'lock':
+             elif btn_type == 'lock':
                  # Toggle lock state
                  action = 'unlock' if self._state == 'locked' else 'lock'
                  self.clicked.emit({**self.config, 'action': action})
@@ -1520,6 +1600,7 @@ class DashboardButton(QFrame):
             self.resize_anim.setEndValue(0.0)
             self.resize_anim.start()
         self.unsetCursor()
+        self._handle_hover = None
         super().leaveEvent(event)
 
     def enterEvent(self, event):
@@ -1533,10 +1614,7 @@ class DashboardButton(QFrame):
             self.update()
             
         # We need to check if mouse is already in the corner
-        pos = self.mapFromGlobal(QCursor.pos())
-        rect = self.rect()
-        size = 28
-        in_corner = (pos.x() >= rect.width() - size) and (pos.y() >= rect.height() - size)
+        in_corner = self._in_handle(self.mapFromGlobal(QCursor.pos()))
         
         if in_corner:
              # Fast restore if we just dropped or entered directly
@@ -1544,6 +1622,7 @@ class DashboardButton(QFrame):
              self.resize_anim.setEndValue(1.0)
              self.resize_anim.start()
              self.setCursor(Qt.CursorShape.SizeFDiagCursor)
+             self._handle_hover = True
         
         super().enterEvent(event)
 
@@ -1554,40 +1633,35 @@ class DashboardButton(QFrame):
         # Forbidden buttons have no context menu
         if self.config and self.config.get('type') == 'forbidden':
             return
+        if self._context_menu is None:
+            self._build_context_menu()
+        
+        configured = bool(self.config)
+        for action in self._configured_actions:
+            action.setVisible(configured)
+        self._add_action.setVisible(not configured)
+        
+        self._context_menu.exec(self.mapToGlobal(pos))
+
+    def _build_context_menu(self):
+        """Create the right-click menu once; actions read slot/config when triggered."""
         menu = QMenu(self)
-        menu.setStyleSheet("""
-            QMenu {
-                background-color: #2b2b2b;
-                border: 1px solid #3d3d3d;
-                border-radius: 6px;
-                padding: 4px;
-            }
-            QMenu::item {
-                background: transparent;
-                padding: 6px 24px 6px 12px;
-                color: #e0e0e0;
-                border-radius: 4px;
-            }
-            QMenu::item:selected {
-                background-color: #007aff;
-                color: white;
-            }
-        """)
-        
-        if self.config:
-            edit_action = menu.addAction("Edit")
-            edit_action.triggered.connect(lambda: self.edit_requested.emit(self.slot))
-            
-            dup_action = menu.addAction("Duplicate")
-            dup_action.triggered.connect(lambda: [print(f"DEBUG: Duplicate action triggered for slot {self.slot}"), self.duplicate_requested.emit(self.slot)])
-            
-            clear_action = menu.addAction("Clear")
-            clear_action.triggered.connect(lambda: self.clear_requested.emit(self.slot))
-        else:
-            add_action = menu.addAction("Add")
-            add_action.triggered.connect(lambda: self.clicked.emit(self.config)) # Trigger click (add)
+        menu.setStyleSheet(_CONTEXT_MENU_QSS)
+        
+        edit_action = menu.addAction("Edit")
+        edit_action.triggered.connect(lambda: self.edit_requested.emit(self.slot))
+        
+        dup_action = menu.addAction("Duplicate")
+        dup_action.triggered.connect(lambda: self.duplicate_requested.emit(self.slot))
+        
+        clear_action = menu.addAction("Clear")
+        clear_action.triggered.connect(lambda: self.clear_requested.emit(self.slot))
         
-        menu.exec(self.mapToGlobal(pos))
+        self._add_action = menu.addAction("Add")
+        self._add_action.triggered.connect(lambda: self.clicked.emit(self.config)) # Trigger click (add)
+        
+        self._configured_actions = (edit_action, dup_action, clear_action)
+        self._context_menu = menu
 
     def simulate_click(self):
         """Programmatically trigger a click."""
@@ -1596,31 +1670,38 @@ class DashboardButton(QFrame):
 
         self.trigger_feedback()
         
+        btn_type = self.config.get('type')
+        
         # Script/Scene: Trigger pulse animation
-        if self.config.get('type') in ['script', 'scene']:
-             self.pulse_anim.stop()
-             self.pulse_anim.start()
+        if btn_type in ('script', 'scene'):
+             self._restart_anim(self.pulse_anim)
         
         # Climate widgets open overlay
-        if self.config.get('type') == 'climate':
-             global_pos = self.mapToGlobal(QPoint(0,0))
-             rect = QRect(global_pos, self.size())
+        if btn_type == 'climate':
+             rect = self._global_rect()
              self.climate_requested.emit(self.slot, rect)
-        elif self.config.get('type') == 'weather':
-             global_pos = self.mapToGlobal(QPoint(0,0))
-             rect = QRect(global_pos, self.size())
+        elif btn_type == 'weather':
+             rect = self._global_rect()
              self.weather_requested.emit(self.slot, rect)
-        elif self.config.get('type') == '3d_printer':
-             global_pos = self.mapToGlobal(QPoint(0,0))
-             rect = QRect(global_pos, self.size())
+        elif btn_type == '3d_printer':
+             rect = self._global_rect()
              self.printer_requested.emit(self.slot, rect, self.config)
-        elif self.config.get('type') == 'lawn_mower':
-             global_pos = self.mapToGlobal(QPoint(0,0))
-             rect = QRect(global_pos, self.size())
+        elif btn_type == 'lawn_mower':
+             rect = self._global_rect()
              self.mower_requested.emit(self.slot, rect)
-        elif self.config.get('type') == 'vacuum':
-             global_pos = self.mapToGlobal(QPoint(0,0))
-             rect = QRect(global_pos, self.size())
+        elif btn_type == 'vacuum':
+             rect = self._global_rect()
              self.vacuum_requested.emit(self.slot, rect)
         else:
              self.clicked.emit(self.config)
+
+
+# Button type -> view updater used by DashboardButton.update_content()
+_VIEW_UPDATERS = {
+    btn_type: getattr(DashboardButton, f'_update_{btn_type}_view')
+    for btn_type in (
+        'weather', 'widget', 'climate', 'curtain', 'script', 'automation',
+        'scene', 'fan', 'media_player', 'camera', '3d_printer',
+        'lawn_mower', 'vacuum', 'input_number',
+    )
+}
@@ -1,8 +1,9 @@
 import math
+from functools import lru_cache
 from PyQt6.QtCore import Qt, QRect, QRectF, QPointF, QPropertyAnimation
 from PyQt6.QtGui import (
     QColor, QFont, QFontMetrics, QPainter, QPainterPath, QColor, QPen, QBrush,
-    QLinearGradient, QConicalGradient, QRadialGradient
+    QLinearGradient, QConicalGradient, QRadialGradient, QPixmap
 )
 from PyQt6.QtWidgets import QApplication
 from ui.icons import get_icon, get_mdi_font, Icons
@@ -13,6 +14,8 @@ from ui.visuals.background_generator import BackgroundGenerator
 class DashboardButtonPainter:
     """Handles custom painting for DashboardButton."""
 
+    RESIZE_HANDLE_SIZE = 28  # Edge length of the bottom-right resize wedge
+
     @staticmethod
     def draw_bottom_bar(painter, rect, value, max_value, color, bar_height=4):
         """Draw a horizontal fill bar at the bottom of a rect.
@@ -37,21 +40,22 @@ class DashboardButtonPainter:
     @staticmethod
     def paint(button, event):
         """Main paint method."""
+        painter = QPainter(button)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
         # Media Player (Apple-like)
         if button.config.get('type') == 'media_player':
-            DashboardButtonPainter._paint_media_player(button)
+            DashboardButtonPainter._paint_media_player(button, painter)
             
         # 3D Printer
         if button.config.get('type') == '3d_printer':
-            DashboardButtonPainter._paint_3d_printer(button)
+            DashboardButtonPainter._paint_3d_printer(button, painter)
         
-        # Draw Camera Image (if applicable)
         # Draw Camera Image (if applicable)
         if button.config and button.config.get('type') == 'camera':
              # Use cached rounded pixmap if available (Performance + Style)
              if hasattr(button, '_cached_display_pixmap') and button._cached_display_pixmap and not button._cached_display_pixmap.isNull():
-                 painter = QPainter(button)
-                 painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+                 painter.save()
                  
                  # Ensure clipping even when using cached pixmap (for the edge effects)
                  path = QPainterPath()
@@ -60,41 +64,32 @@ class DashboardButtonPainter:
                  
                  painter.drawPixmap(0, 0, button._cached_display_pixmap)
                  DashboardButtonPainter.draw_image_edge_effects(painter, QRectF(button.rect()), is_top_clamped=False)
-                 painter.end()
+                 painter.restore()
              
              # Fallback to direct scaling if cache missing (e.g. first frame or resize race condition)
              elif hasattr(button, '_last_camera_pixmap') and button._last_camera_pixmap:
-                 painter = QPainter(button)
-                 painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+                 painter.save()
                  
                  # Clip to rounded rect
                  path = QPainterPath()
                  path.addRoundedRect(QRectF(button.rect()), 12, 12)
                  painter.setClipPath(path)
                  
-                 # Scale to fill button while maintaining aspect ratio (crop if needed)
-                 scaled = button._last_camera_pixmap.scaled(
-                     button.width(), button.height(),
-                     Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                     Qt.TransformationMode.SmoothTransformation
+                 # Scale to fill button while maintaining aspect ratio (center crop)
+                 scaled, x, y = DashboardButtonPainter._cover_scaled(
+                     button, '_scaled_camera_cache', button._last_camera_pixmap, button.width(), button.height()
                  )
                  
-                 # Center crop
-                 x = (scaled.width() - button.width()) // 2
-                 y = (scaled.height() - button.height()) // 2
-                 
                  # Draw cropped
                  painter.drawPixmap(0, 0, scaled, x, y, button.width(), button.height())
                  DashboardButtonPainter.draw_image_edge_effects(painter, QRectF(button.rect()), is_top_clamped=False)
-                 painter.end()
+                 painter.restore()
                  
         # === Camera Pill Label ===
         if button.config and button.config.get('type') == 'camera':
              label = button.config.get('label')
              if label:
-                 # Re-open painter for overlay
-                 painter = QPainter(button)
-                 painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+                 painter.save()
                  
                  # Prepare background for blur
                  bg_pix = None
@@ -104,56 +99,75 @@ class DashboardButtonPainter:
                  if hasattr(button, '_cached_display_pixmap') and button._cached_display_pixmap and not button._cached_display_pixmap.isNull():
                      bg_pix = button._cached_display_pixmap
                  elif hasattr(button, '_last_camera_pixmap') and button._last_camera_pixmap:
-                     # For fallback, we need to replicate the scale/crop to get correct blur source
-                     # This is expensive but fallback is rare
-                     scaled = button._last_camera_pixmap.scaled(
-                         button.width(), button.height(),
-                         Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                         Qt.TransformationMode.SmoothTransformation
+                     # For fallback, reuse the image path's scale/crop as the blur source
+                     bg_pix, x_off, y_off = DashboardButtonPainter._cover_scaled(
+                         button, '_scaled_camera_cache', button._last_camera_pixmap, button.width(), button.height()
                      )
-                     bg_pix = scaled
-                     x_off = (scaled.width() - button.width()) // 2
-                     y_off = (scaled.height() - button.height()) // 2
                  
                  DashboardButtonPainter._draw_pill_label(painter, button.rect(), label, bg_pix, x_off, y_off)
-                 painter.end()
+                 painter.restore()
         
         # Pulse Animation (Script)
         if button._pulse_opacity > 0.01:
-            DashboardButtonPainter._paint_pulse(button)
+            DashboardButtonPainter._paint_pulse(button, painter)
         
         # Only draw special border if animating or if progress > 0
         if button.anim.state() == QPropertyAnimation.State.Running or button._anim_progress > 0.0:
-            DashboardButtonPainter._paint_border_animation(button)
+            DashboardButtonPainter._paint_border_animation(button, painter)
             
         # Draw input_number blink feedback
         if getattr(button, '_input_blink_opacity', 0.0) > 0.01 and button.config.get('type') == 'input_number':
-            DashboardButtonPainter._paint_input_blink(button)
+            DashboardButtonPainter._paint_input_blink(button, painter)
             
         # Draw input_number hover arrows
         if getattr(button, '_arrow_opacity', 0.0) > 0.01 and button.config.get('type') == 'input_number':
-            DashboardButtonPainter._paint_input_arrows(button)
+            DashboardButtonPainter._paint_input_arrows(button, painter)
 
         if not button.config:
-            DashboardButtonPainter._paint_empty_slot(button)
+            DashboardButtonPainter._paint_empty_slot(button, painter)
 
-        # Draw Resize Handle (Glass-like)
-        if button._resize_handle_opacity > 0.01:
-            DashboardButtonPainter._paint_resize_handle(button)
+        # Draw Resize Handle (Glass-like) - skipped when the dirty region misses its corner
+        size = DashboardButtonPainter.RESIZE_HANDLE_SIZE
+        handle_rect = QRect(button.width() - size, button.height() - size, size, size)
+        if button._resize_handle_opacity > 0.01 and event.rect().intersects(handle_rect):
+            DashboardButtonPainter._paint_resize_handle(button, painter)
 
         # UNIVERSAL EDGE BEVEL HIGHLIGHT
         # Gives ALL configured buttons a subtle physical lip, making them feel like 3D glass/plastic tiles
         button_style = getattr(button, 'button_style', 'Gradient')
         if button.config and button.config.get('type') != 'forbidden' and button_style == 'Gradient':
-            painter = QPainter(button)
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-            DashboardButtonPainter.draw_button_bevel_edge(painter, QRectF(button.rect()), intensity_modifier=0.25)
-            painter.end()
+            dpr = button.devicePixelRatioF()
+            painter.drawPixmap(0, 0, DashboardButtonPainter._bevel_pixmap(button.width(), button.height(), dpr))
+
+        painter.end()
 
     @staticmethod
-    def _paint_media_player(button):
-        painter = QPainter(button)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    def _cover_scaled(button, cache_attr, source, w, h):
+        """Scale source to cover w x h, cached on the button until the source or size changes.
+
+        Returns (scaled, x_off, y_off) where the offsets center-crop the result.
+        """
+        key = (source.cacheKey(), w, h)
+        cached = getattr(button, cache_attr, None)
+        if cached is None or cached[0] != key:
+            scaled = source.scaled(
+                w, h,
+                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+                Qt.TransformationMode.SmoothTransformation
+            )
+            cached = (key, scaled, (scaled.width() - w) // 2, (scaled.height() - h) // 2)
+            setattr(button, cache_attr, cached)
+        return cached[1:]
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _static_media_bg(seed, w, h):
+        """Frozen light-field background; deterministic per (seed, size), so generate it once."""
+        return BackgroundGenerator.generate(w, h, seed=seed)
+
+    @staticmethod
+    def _paint_media_player(button, painter):
+        painter.save()
         
         rect = button.rect()
         is_playing = button._state == "playing"
@@ -178,15 +192,10 @@ class DashboardButtonPainter:
         has_art = button._album_art and not button._album_art.isNull()
         show_art = button.config.get('show_album_art', True)
         if (is_huge or is_tall or is_wide) and has_art and show_art:
-            # Draw blurred/dimmed album art
-            scaled = button._album_art.scaled(
-                rect.width(), rect.height(),
-                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                Qt.TransformationMode.SmoothTransformation
+            # Draw blurred/dimmed album art (center crop)
+            scaled, x_off, y_off = DashboardButtonPainter._cover_scaled(
+                button, '_scaled_art_cache', button._album_art, rect.width(), rect.height()
             )
-            # Center crop
-            x_off = (scaled.width() - rect.width()) // 2
-            y_off = (scaled.height() - rect.height()) // 2
             painter.drawPixmap(0, 0, scaled, x_off, y_off, rect.width(), rect.height())
             
             # Gradient overlay: user color at bottom -> transparent at top
@@ -227,7 +236,7 @@ class DashboardButtonPainter:
                  painter.drawPixmap(0, 0, bg)
              else:
                  # --- Static background (original behaviour) ---
-                 bg_pixmap = BackgroundGenerator.generate(w, h, seed=seed)
+                 bg_pixmap = DashboardButtonPainter._static_media_bg(seed, w, h)
                  painter.drawPixmap(0, 0, bg_pixmap)
 
              # Gradient overlay (for text readability)
@@ -384,12 +393,11 @@ class DashboardButtonPainter:
             painter.setFont(get_mdi_font(28))
             painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, play_icon)
 
-        painter.end()
+        painter.restore()
 
     @staticmethod
-    def _paint_3d_printer(button):
-        painter = QPainter(button)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    def _paint_3d_printer(button, painter):
+        painter.save()
         
         rect = button.rect()
         is_huge = button.span_x >= 2 and button.span_y >= 2  # 2x2+
@@ -525,17 +533,11 @@ class DashboardButtonPainter:
                       y_bg = 0
                  else:
                       # Aspect fill the top section
-                      scaled = camera_pixmap.scaled(
-                          int(w), int(cam_h),
-                          Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                          Qt.TransformationMode.SmoothTransformation
+                      scaled, x_bg, y_bg = DashboardButtonPainter._cover_scaled(
+                          button, '_scaled_printer_cam_cache', camera_pixmap, int(w), int(cam_h)
                       )
-                      x_off = (scaled.width() - w) / 2
-                      y_off = (scaled.height() - cam_h) / 2
-                      painter.drawPixmap(0, 0, scaled, int(x_off), int(y_off), int(w), int(cam_h))
+                      painter.drawPixmap(0, 0, scaled, x_bg, y_bg, int(w), int(cam_h))
                       bg_pix = scaled
-                      x_bg = int(x_off)
-                      y_bg = int(y_off)
                       
                  # Add glass edge effects (shadow + highlight) to the camera feed
                  DashboardButtonPainter.draw_image_edge_effects(painter, cam_rect, is_top_clamped=True)
@@ -731,18 +733,14 @@ class DashboardButtonPainter:
                  painter.setPen(text_color)
                  painter.drawText(QRectF(0, h/2 + 20, w, 20), Qt.AlignmentFlag.AlignCenter, f"{prog_val:.0f}%")
 
-        painter.end()
+        painter.restore()
 
     @staticmethod
-    def _paint_pulse(button):
-        painter = QPainter(button)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    def _paint_pulse(button, painter):
+        painter.save()
         
         # Use custom color or accent
-        c = QColor("#0078d4")
-        if button.theme_manager:
-            colors = button.theme_manager.get_colors()
-            c = QColor(colors.get('accent', '#0078d4'))
+        c = QColor(button._accent_qcolor)
         
         # Allow custom color override
         if button.config and 'color' in button.config:
@@ -754,13 +752,12 @@ class DashboardButtonPainter:
         painter.setBrush(QBrush(c))
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawRoundedRect(QRectF(button.rect()), 12, 12)
-        painter.end()
+        painter.restore()
 
     @staticmethod
-    def _paint_input_blink(button):
+    def _paint_input_blink(button, painter):
         """Draw a quick white flash over the button when value changes."""
-        painter = QPainter(button)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.save()
         
         c = QColor(255, 255, 255)
         c.setAlphaF(button._input_blink_opacity)
@@ -768,13 +765,12 @@ class DashboardButtonPainter:
         painter.setBrush(QBrush(c))
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawRoundedRect(QRectF(button.rect()), 12, 12)
-        painter.end()
+        painter.restore()
         
     @staticmethod
-    def _paint_input_arrows(button):
+    def _paint_input_arrows(button, painter):
         """Draw minimalist up/down arrows on hover."""
-        painter = QPainter(button)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.save()
         
         # Determine color based on theme
         if button.theme_manager:
@@ -817,12 +813,11 @@ class DashboardButtonPainter:
             down_rect = QRectF(0, h * 0.75 - 8, w, h * 0.25)
             painter.drawText(down_rect, Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignBottom, Icons.CHEVRON_DOWN)
         
-        painter.end()
+        painter.restore()
 
     @staticmethod
-    def _paint_border_animation(button):
-        painter = QPainter(button)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    def _paint_border_animation(button, painter):
+        painter.save()
         
         # Interactive 'Press' feedback
         speed = 0.9 if button._border_effect == 'Prism Shard' else 1.5
@@ -847,43 +842,39 @@ class DashboardButtonPainter:
             DashboardButtonPainter.draw_prism_shard_border(painter, rect, angle)
         elif button._border_effect == 'Liquid Mercury':
             DashboardButtonPainter.draw_liquid_mercury_border(painter, rect, angle)
-        painter.end()
+        painter.restore()
+
+    _DASHED_PENS = {}  # is_light -> shared empty-slot border pen
 
     @staticmethod
-    def _paint_empty_slot(button):
+    def _dashed_pen(is_light):
+        """Return the shared dashed empty-slot pen for the given theme."""
+        pen = DashboardButtonPainter._DASHED_PENS.get(is_light)
+        if pen is None:
+            pen = QPen(QColor("#c0c0c0") if is_light else QColor("#555555"))
+            pen.setStyle(Qt.PenStyle.DashLine)
+            pen.setWidth(2)
+            DashboardButtonPainter._DASHED_PENS[is_light] = pen
+        return pen
+
+    @staticmethod
+    def _paint_empty_slot(button, painter):
         # Dashed border for empty slots (drawn over stylesheet bg)
-        painter = QPainter(button)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.save()
         rect = button.rect().adjusted(1, 1, -1, -1)
         
         # Theme-aware border color
-        is_light = (button.theme_manager and button.theme_manager.get_effective_theme() == 'light')
-        border_color = QColor("#c0c0c0") if is_light else QColor("#555555")
-        
-        if not hasattr(button, '_dashed_pen') or getattr(button, '_dashed_pen_light', None) != is_light:
-            button._dashed_pen = QPen(border_color)
-            button._dashed_pen.setStyle(Qt.PenStyle.DashLine)
-            button._dashed_pen.setWidth(2)
-            button._dashed_pen_light = is_light
-            
-        painter.setPen(button._dashed_pen)
+        is_light = bool(button.theme_manager and button.theme_manager.get_effective_theme() == 'light')
+        painter.setPen(DashboardButtonPainter._dashed_pen(is_light))
         painter.setBrush(Qt.BrushStyle.NoBrush)
         painter.drawRoundedRect(rect, 10, 10)
             
-        painter.end()
+        painter.restore()
 
     @staticmethod
-    def _paint_resize_handle(button):
-        painter = QPainter(button)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Opacity control
-        painter.setOpacity(button._resize_handle_opacity)
-        
-        # Bottom-right corner
-        r = button.rect()
+    def _build_resize_handle_path(r, handle_size):
+        """Glass wedge in the bottom-right corner, following the button's rounded corner."""
         radius = 12 # Match button border radius
-        handle_size = 28 # Bigger handle
         
         path = QPainterPath()
         
@@ -901,23 +892,41 @@ class DashboardButtonPainter:
         path.quadTo(r.right() - 4, r.bottom() - 4, r.right() - handle_size, r.bottom())
         
         path.closeSubpath()
+        return path
+
+    @staticmethod
+    def _paint_resize_handle(button, painter):
+        painter.save()
         
-        # Glass Style
-        painter.setPen(Qt.PenStyle.NoPen)
+        # Opacity control
+        painter.setOpacity(button._resize_handle_opacity)
         
-        # Gradient for glass/shiny look
-        grad = QLinearGradient(QPointF(r.right() - handle_size, r.bottom() - handle_size), QPointF(r.bottomRight()))
-        grad.setColorAt(0.0, QColor(255, 255, 255, 120)) # Start brighter 
-        grad.setColorAt(1.0, QColor(255, 255, 255, 10))  # Fade out
+        # Bottom-right corner
+        r = button.rect()
+        handle_size = DashboardButtonPainter.RESIZE_HANDLE_SIZE
         
-        painter.setBrush(QBrush(grad))
-        painter.drawPath(path)
+        # Path, brush and pen only depend on the button size - reuse them across the fade animation frames
+        if getattr(button, '_handle_path_size', None) != r.size():
+            button._handle_path = DashboardButtonPainter._build_resize_handle_path(r, handle_size)
+            
+            # Gradient for glass/shiny look
+            grad = QLinearGradient(QPointF(r.right() - handle_size, r.bottom() - handle_size), QPointF(r.bottomRight()))
+            grad.setColorAt(0.0, QColor(255, 255, 255, 120)) # Start brighter 
+            grad.setColorAt(1.0, QColor(255, 255, 255, 10))  # Fade out
+            button._handle_brush = QBrush(grad)
+            
+            # Accent line (Inner Edge only) for sharpness
+            button._handle_pen = QPen(QColor(255, 255, 255, 70))
+            button._handle_pen.setWidthF(2.0)
+            button._handle_path_size = r.size()
+        path = button._handle_path
         
-        # Accent line (Inner Edge only) for sharpness
-        pen = QPen(QColor(255, 255, 255, 70))
-        pen.setWidthF(2.0)
-        painter.strokePath(path, pen)
-        painter.end()
+        # Glass Style
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(button._handle_brush)
+        painter.drawPath(path)
+        painter.strokePath(path, button._handle_pen)
+        painter.restore()
 
     @staticmethod
     def _draw_pill_label(painter, rect, label, background_pixmap=None, x_off=0, y_off=0, position='top-center', forced_bg_color=None, forced_text_color=None):
@@ -996,45 +1005,46 @@ class DashboardButtonPainter:
         painter.setPen(text_color)
         painter.drawText(pill_rect, Qt.AlignmentFlag.AlignCenter, label.upper())
 
+    # Border effect palettes (first color repeated last so the conical sweep loops seamlessly)
+    RAINBOW_COLORS = ("#4285F4", "#EA4335", "#FBBC05", "#34A853", "#4285F4")
+    AURORA_COLORS = ("#00C896", "#0078FF", "#8C00FF", "#0078FF", "#00C896")
+    # Muted jewel tones for a less "neon" look
+    PRISM_SHARD_COLORS = ("#26C6DA", "#EC407A", "#FFCA28", "#CFD8DC", "#26C6DA")
+    # Gunmetal Chrome: Darker, more sophisticated palette
+    LIQUID_MERCURY_COLORS = ("#37474F", "#78909C", "#CFD8DC", "#ECEFF1", "#CFD8DC", "#78909C", "#37474F")
+
     @staticmethod
     def draw_rainbow_border(painter, rect, angle):
-        colors = ["#4285F4", "#EA4335", "#FBBC05", "#34A853", "#4285F4"]
-        DashboardButtonPainter.draw_gradient_border(painter, rect, angle, colors)
+        DashboardButtonPainter.draw_gradient_border(painter, rect, angle, DashboardButtonPainter.RAINBOW_COLORS)
 
     @staticmethod
     def draw_aurora_border(painter, rect, angle):
-        colors = ["#00C896", "#0078FF", "#8C00FF", "#0078FF", "#00C896"]
-        DashboardButtonPainter.draw_gradient_border(painter, rect, angle, colors)
+        DashboardButtonPainter.draw_gradient_border(painter, rect, angle, DashboardButtonPainter.AURORA_COLORS)
 
     @staticmethod
     def draw_prism_shard_border(painter, rect, angle):
-        # Muted jewel tones for a less "neon" look
-        colors = ["#26C6DA", "#EC407A", "#FFCA28", "#CFD8DC", "#26C6DA"]
-        DashboardButtonPainter.draw_gradient_border(painter, rect, angle, colors)
+        DashboardButtonPainter.draw_gradient_border(painter, rect, angle, DashboardButtonPainter.PRISM_SHARD_COLORS)
 
     @staticmethod
     def draw_liquid_mercury_border(painter, rect, angle):
-        # Gunmetal Chrome: Darker, more sophisticated palette
-        colors = ["#37474F", "#78909C", "#CFD8DC", "#ECEFF1", "#CFD8DC", "#78909C", "#37474F"]
-        DashboardButtonPainter.draw_gradient_border(painter, rect, angle, colors)
+        DashboardButtonPainter.draw_gradient_border(painter, rect, angle, DashboardButtonPainter.LIQUID_MERCURY_COLORS)
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _gradient_stops(colors):
+        """Evenly spaced (position, QColor) stops for a palette, parsed once."""
+        return [(i / (len(colors) - 1), QColor(color)) for i, color in enumerate(colors)]
 
     @staticmethod
     def draw_gradient_border(painter, rect, angle, colors):
-        """Draw a conical gradient border."""
-        gradient = QConicalGradient(QPointF(rect.center()), angle)
-        
-        # Ensure smooth loop if not already handled
-        if colors[0] != colors[-1]:
-             # If colors don't wrap, we might need logic, but for Rainbow/Aurora they usually loop naturally 
-             # or are defined to loop. If we pass custom 2 colors, we expect the caller to make them loop (C1, C2, C1).
-             pass
+        """Draw a conical gradient border.
 
-        for i, color in enumerate(colors):
-            gradient.setColorAt(i / (len(colors) - 1), QColor(color))
+        The palette should loop (C1, ..., C1) for a seamless sweep.
+        """
+        gradient = QConicalGradient(QPointF(rect.center()), angle)
+        gradient.setStops(DashboardButtonPainter._gradient_stops(tuple(colors)))
         
-        pen = QPen()
-        pen.setWidth(2)
-        pen.setBrush(QBrush(gradient))
+        pen = QPen(QBrush(gradient), 2)
         
         painter.setPen(pen)
         painter.setBrush(Qt.BrushStyle.NoBrush)
@@ -1065,6 +1075,19 @@ class DashboardButtonPainter:
             
         painter.restore()
 
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _bevel_pixmap(w, h, dpr):
+        """Pre-rendered universal bevel for a button size (shared by all same-sized buttons)."""
+        pixmap = QPixmap(round(w * dpr), round(h * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        p = QPainter(pixmap)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        DashboardButtonPainter.draw_button_bevel_edge(p, QRectF(0, 0, w, h), intensity_modifier=0.25)
+        p.end()
+        return pixmap
+
     @staticmethod
     def draw_button_bevel_edge(painter, rect, intensity_modifier=1.0, is_top_clamped=False):
         """Draws a bright top-left specular highlight to simulate physical glass/plastic thickness."""
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from PyQt6.QtGui import QColor
 from ui.styles import Typography, Dimensions
 
@@ -5,6 +7,7 @@ class DashboardButtonStyleManager:
     """Handles QSS styling for DashboardButton."""
     
     @staticmethod
+    @lru_cache(maxsize=128)
     def _get_gradient(color_str, lighten_factor=110):
         c_base = QColor(color_str)
         c_top = c_base.lighter(lighten_factor)
@@ -12,6 +15,17 @@ class DashboardButtonStyleManager:
         color_bottom = f"rgba({c_base.red()}, {c_base.green()}, {c_base.blue()}, {c_base.alphaF():.2f})"
         return f"background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1, stop: 0 {color_top}, stop: 1 {color_bottom});"
 
+    @staticmethod
+    def _set_style_sheet(button, qss: str):
+        """Apply qss only if it differs from what the button already has.
+
+        setStyleSheet() re-parses the sheet and re-polishes the button and its
+        labels, so skip it for the frequent state updates that don't change the look.
+        """
+        if qss != button._applied_qss:
+            button._applied_qss = qss
+            button.setStyleSheet(qss)
+
     @staticmethod
     def apply_style(button):
         """Update visual style based on state and theme."""
@@ -48,7 +62,7 @@ class DashboardButtonStyleManager:
             else:
                 bg_style = f"background-color: {colors['alternate_base']};"
                 
-            button.setStyleSheet(f"""
+            DashboardButtonStyleManager._set_style_sheet(button, f"""
                 DashboardButton {{
                     {bg_style}
                     border-radius: {Dimensions.RADIUS_XLARGE};
@@ -63,7 +77,7 @@ class DashboardButtonStyleManager:
             else:
                 bg_style = f"background-color: {colors['alternate_base']};"
                 
-            button.setStyleSheet(f"""
+            DashboardButtonStyleManager._set_style_sheet(button, f"""
                 DashboardButton {{
                     {bg_style}
                     border-radius: {Dimensions.RADIUS_XLARGE};
@@ -125,7 +139,7 @@ class DashboardButtonStyleManager:
              else:
                  bg_style = f"background-color: {button_color};"
              
-             button.setStyleSheet(f"""
+             DashboardButtonStyleManager._set_style_sheet(button, f"""
                 DashboardButton {{
                     {bg_style}
                     border-radius: {Dimensions.RADIUS_XLARGE};
@@ -184,7 +198,7 @@ class DashboardButtonStyleManager:
                  bg_style = f"background-color: {colors['base']};"
                  bg_hover_style = f"background-color: {colors['alternate_base']};"
             
-            button.setStyleSheet(f"""
+            DashboardButtonStyleManager._set_style_sheet(button, f"""
                 DashboardButton {{
                     {bg_style}
                     border-radius: 12px;